@@ -1,4 +1,10 @@
 import re
+from functools import lru_cache
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional; fall back to the stdlib engine
+    re2 = None
 
 
 RULE_PACKS = {
@@ -7,53 +13,125 @@ RULE_PACKS = {
             'id': 'data_sale',
             'label': 'Data Sale/Sharing',
             'severity': 'high',
-            'regex': r'\b(sell|sale|sharing|share|sold)\b.*\b(data|information|personal)\b|\b(data|information|personal)\b.*\b(sell|sale|sharing|share|sold)\b'
+            'regex': r'\b(sell|sale|sharing|share|sold)\b.*\b(data|information|personal)\b|\b(data|information|personal)\b.*\b(sell|sale|sharing|share|sold)\b',
+            'keywords': ['sell', 'sale', 'shar', 'sold']
         },
         {
             'id': 'arb_waiver',
             'label': 'Arbitration / Class Action Waiver',
             'severity': 'medium',
-            'regex': r'\barbitrat(e|ion|or)\b|\bclass action waiver\b|\bwaive.*class action\b'
+            'regex': r'\barbitrat(e|ion|or)\b|\bclass action waiver\b|\bwaive.*class action\b',
+            'keywords': ['arbitrat', 'waive']
         },
         {
             'id': 'tracking',
             'label': 'Tracking/Advertising',
             'severity': 'medium',
-            'regex': r'\b(cookie|cookies|tracking|track|beacon|pixel|advertising|advertise)\b'
+            'regex': r'\b(cookie|cookies|tracking|track|beacon|pixel|advertising|advertise)\b',
+            'keywords': ['cookie', 'track', 'beacon', 'pixel', 'advertis']
         },
         {
             'id': 'location',
             'label': 'Location Data',
             'severity': 'medium',
-            'regex': r'\b(location|geolocation|gps|geographic)\b.*\b(data|information|track)\b|\b(collect|use|process)\b.*\b(location|geolocation)\b'
+            'regex': r'\b(location|geolocation|gps|geographic)\b.*\b(data|information|track)\b|\b(collect|use|process)\b.*\b(location|geolocation)\b',
+            'keywords': ['location', 'gps', 'geographic']
         },
         {
             'id': 'retention',
             'label': 'Data Retention',
             'severity': 'low',
-            'regex': r'\b(retain|retention|keep|store|storing)\b.*\b(data|information|records)\b'
+            'regex': r'\b(retain|retention|keep|store|storing)\b.*\b(data|information|records)\b',
+            'keywords': ['retain', 'retention', 'keep', 'stor']
         },
         {
             'id': 'children',
             'label': "Children's Data (COPPA)",
             'severity': 'high',
-            'regex': r'\b(child(ren)?|minor|minors|under (13|18)|kids|coppa)\b'
+            'regex': r'\b(child(ren)?|minor|minors|under (13|18)|kids|coppa)\b',
+            'keywords': ['child', 'minor', 'under', 'kids', 'coppa']
         }
     ]
 }
 
 
+def _build_prefilter(rules: list[dict]) -> re.Pattern:
+    # Every rule match contains at least one of its keywords, so text without
+    # any keyword cannot match any rule in the pack
+    keywords = [keyword for rule in rules for keyword in rule['keywords']]
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+PACK_PREFILTERS = {name: _build_prefilter(rules) for name, rules in RULE_PACKS.items()}
+
+PACK_RULE_IDS = {
+    name: frozenset(rule['id'] for rule in rules)
+    for name, rules in RULE_PACKS.items()
+}
+
+
+def _build_rule_set(rules: list[dict]):
+    if re2 is None:
+        return None
+    
+    options = re2.Options()
+    options.case_sensitive = False
+    rule_set = re2.Set.SearchSet(options)
+    try:
+        for rule in rules:
+            rule_set.Add(rule['regex'])
+        rule_set.Compile()
+    except re2.error:
+        return None
+    return rule_set
+
+
+RULE_SETS = {name: _build_rule_set(rules) for name, rules in RULE_PACKS.items()}
+
+
+@lru_cache(maxsize=256)
+def _combined_pattern(pack_name: str, rule_ids: frozenset[str]) -> re.Pattern:
+    alternatives = [
+        f"(?P<{rule['id']}>{rule['regex']})"
+        for rule in RULE_PACKS[pack_name]
+        if rule['id'] in rule_ids
+    ]
+    return re.compile('|'.join(alternatives), re.IGNORECASE)
+
+
+def _fired_rule_ids(pack_name: str, text: str) -> set[str]:
+    if PACK_PREFILTERS[pack_name].search(text) is None:
+        return set()
+    
+    # One scan finds the leftmost hit among all remaining rules; rules that
+    # already fired are dropped so overlapping matches are not lost.
+    remaining = PACK_RULE_IDS[pack_name]
+    fired = set()
+    while remaining:
+        match = _combined_pattern(pack_name, remaining).search(text)
+        if match is None:
+            break
+        fired.add(match.lastgroup)
+        remaining = remaining - {match.lastgroup}
+    return fired
+
+
 def tag_section(text: str, packs: list[str]) -> list[dict]:
     tags = []
-    text_lower = text.lower()
     
     for pack_name in packs:
         if pack_name not in RULE_PACKS:
             continue
         
-        for rule in RULE_PACKS[pack_name]:
-            pattern = re.compile(rule['regex'], re.IGNORECASE)
-            if pattern.search(text_lower):
+        rules = RULE_PACKS[pack_name]
+        rule_set = RULE_SETS[pack_name]
+        if rule_set is not None:
+            fired = {rules[i]['id'] for i in rule_set.Match(text) or ()}
+        else:
+            fired = _fired_rule_ids(pack_name, text)
+        
+        for rule in rules:
+            if rule['id'] in fired:
                 tags.append({
                     'id': rule['id'],
                     'label': rule['label'],
@@ -71,12 +149,10 @@ def analyze_sections(sections: list[dict], packs: list[str]) -> list[dict]:
         tags = tag_section(text, packs)
         
         if tags:
-            snippet = text[:500] if len(text) > 500 else text
-            
             findings.append({
                 'heading': section['heading'],
                 'text': text,
-                'snippet': snippet,
+                'snippet': text[:500],
                 'tags': tags
             })
     
@@ -1,15 +1,16 @@
-import time
+import asyncio
 from typing import Literal
 from pathlib import Path
 from fastapi import FastAPI, Query
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from pydantic import BaseModel
-from bs4 import BeautifulSoup
-import requests
+import httpx
 
-from .crawler import discover_policy_links, fetch, CRWLR_MAX_DOCS
-from .extract import extract_main_content, sectionize
+from .crawler import (
+    discover_policy_links, fetch_async, CRWLR_MAX_DOCS, CRWLR_TIMEOUT_SECONDS, CRWLR_UA
+)
+from .extract import parse_html, extract_title, extract_main_content, sectionize
 from .analyze import analyze_sections
 from .storage import init_db, store_document, store_findings, get_cached_result
 
@@ -20,7 +21,8 @@ STATIC_DIR = BASE_DIR / "static"
 app = FastAPI(
     title="CRWLR - Terms & Privacy Policy Analyzer",
     description="Discovers and analyzes Terms of Service and Privacy Policy pages",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
@@ -69,6 +71,65 @@ async def root():
     return FileResponse(str(STATIC_DIR / "index.html"))
 
 
+async def fetch_and_parse(
+    client: httpx.AsyncClient,
+    link: str,
+    pack_list: list[str],
+    persist: bool
+) -> tuple[dict | None, dict | None]:
+    if persist:
+        cached = get_cached_result(link)
+        if cached:
+            return cached, None
+    
+    retry_delays = [0.5, 1.5]
+    
+    for attempt in range(3):
+        try:
+            resp = await fetch_async(client, link)
+            
+            # Parsed once and shared with the helpers; readability only
+            # accepts markup, so it still reads resp.text itself
+            page = parse_html(resp.text)
+            title = extract_title(page) or link
+            
+            main_content = extract_main_content(resp.text)
+            sections = sectionize(parse_html(main_content))
+            findings = analyze_sections(sections, pack_list)
+            
+            result = {
+                'url': link,
+                'title': title,
+                'cached': False,
+                'findings': findings
+            }
+            
+            if persist:
+                store_document(link, title, len(resp.text))
+                store_findings(link, findings)
+            
+            return result, None
+            
+        except httpx.TimeoutException:
+            if attempt < 2:
+                await asyncio.sleep(retry_delays[attempt])
+            else:
+                return None, {'url': link, 'reason': 'timeout'}
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code >= 500:
+                return None, {'url': link, 'reason': 'http_5xx'}
+            return None, {'url': link, 'reason': 'http_4xx'}
+        except httpx.RequestError:
+            if attempt < 2:
+                await asyncio.sleep(retry_delays[attempt])
+            else:
+                return None, {'url': link, 'reason': 'network'}
+        except Exception:
+            return None, {'url': link, 'reason': 'parse'}
+    
+    return None, None
+
+
 @app.get("/analyze", response_model=AnalyzeResponse)
 async def analyze(
     url: str = Query(..., description="Seed URL to analyze"),
@@ -88,69 +149,31 @@ async def analyze(
     errors = []
     skipped_due_to_robots = []
     
-    for link in policy_links[:CRWLR_MAX_DOCS]:
-        if persist:
-            cached = get_cached_result(link)
-            if cached:
-                results.append(cached)
-                continue
-        
-        retry_delays = [0.5, 1.5]
-        success = False
-        
-        for attempt in range(3):
-            try:
-                resp = fetch(link)
-                
-                soup = BeautifulSoup(resp.text, 'lxml')
-                title_tag = soup.find('title')
-                title = title_tag.get_text().strip() if title_tag else link
-                
-                main_content = extract_main_content(resp.text)
-                sections = sectionize(main_content)
-                findings = analyze_sections(sections, pack_list)
-                
-                result = {
-                    'url': link,
-                    'title': title,
-                    'cached': False,
-                    'findings': findings
-                }
-                
-                if persist:
-                    store_document(link, title, len(resp.text))
-                    store_findings(link, findings)
-                
-                results.append(result)
-                success = True
-                break
-                
-            except requests.exceptions.Timeout:
-                if attempt < 2:
-                    time.sleep(retry_delays[attempt])
-                else:
-                    errors.append({'url': link, 'reason': 'timeout'})
-                    break
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code >= 500:
-                    errors.append({'url': link, 'reason': 'http_5xx'})
-                else:
-                    errors.append({'url': link, 'reason': 'http_4xx'})
-                break
-            except requests.exceptions.RequestException:
-                if attempt < 2:
-                    time.sleep(retry_delays[attempt])
-                else:
-                    errors.append({'url': link, 'reason': 'network'})
-                    break
-            except Exception:
-                errors.append({'url': link, 'reason': 'parse'})
-                break
+    async with httpx.AsyncClient(
+        timeout=CRWLR_TIMEOUT_SECONDS,
+        headers={'User-Agent': CRWLR_UA},
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=16)
+    ) as client:
+        outcomes = await asyncio.gather(*(
+            fetch_and_parse(client, link, pack_list, persist)
+            for link in policy_links[:CRWLR_MAX_DOCS]
+        ))
     
-    return AnalyzeResponse(
+    for result, error in outcomes:
+        if result is not None:
+            results.append(result)
+        if error is not None:
+            errors.append(error)
+    
+    response = AnalyzeResponse(
         seed=url,
         policy_links=policy_links,
         results=results,
         errors=errors,
         skipped_due_to_robots=skipped_due_to_robots if respect_robots else None
     )
+    
+    # Already validated above; returning a Response skips FastAPI's second
+    # validation pass and Python-level JSON encoding of every finding
+    return Response(content=response.model_dump_json(), media_type="application/json")
@@ -1,30 +1,56 @@
 import os
 import time
+import httpx
 import requests
-from bs4 import BeautifulSoup
-from .utils import is_probable_policy_path, absolutize, same_registrable_domain
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from .utils import is_probable_policy_path, absolutize, registrable_domain
 
 
 CRWLR_TIMEOUT_SECONDS = int(os.getenv('CRWLR_TIMEOUT_SECONDS', '15'))
 CRWLR_MAX_DOCS = int(os.getenv('CRWLR_MAX_DOCS', '4'))
 CRWLR_UA = os.getenv('CRWLR_UA', 'CRWLR/0.1 (+contact@example.invalid)')
 CRWLR_MAX_BYTES = int(os.getenv('CRWLR_MAX_BYTES', '1048576'))
+CRWLR_DISCOVERY_TTL_SECONDS = int(os.getenv('CRWLR_DISCOVERY_TTL_SECONDS', '3600'))
+
+FETCH_CHUNK_SIZE = 65536
+DISCOVERY_CACHE_SIZE = 1024
+
+_DISCOVERY_CACHE: dict[str, tuple[float, list[str]]] = {}
+
+
+_ANCHOR_STRAINER = SoupStrainer('a', href=True)
+
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = CRWLR_UA
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
 
 
 def discover_policy_links(seed_url: str) -> list[str]:
+    now = time.monotonic()
+    cached = _DISCOVERY_CACHE.get(seed_url)
+    if cached and now - cached[0] < CRWLR_DISCOVERY_TTL_SECONDS:
+        return list(cached[1])
+    
     links = set()
+    seed_fetched = False
     
     try:
         resp = fetch(seed_url, timeout=CRWLR_TIMEOUT_SECONDS)
-        soup = BeautifulSoup(resp.text, 'lxml')
+        soup = BeautifulSoup(resp.content, 'lxml', parse_only=_ANCHOR_STRAINER)
+        seed_domain = registrable_domain(seed_url)
         
         for a_tag in soup.find_all('a', href=True):
             href = a_tag['href']
             absolute_url = absolutize(seed_url, href)
             
-            if same_registrable_domain(seed_url, absolute_url):
+            if registrable_domain(absolute_url) == seed_domain:
                 if is_probable_policy_path(absolute_url):
                     links.add(absolute_url)
+        
+        seed_fetched = True
     except Exception:
         pass
     
@@ -45,20 +71,62 @@ def discover_policy_links(seed_url: str) -> list[str]:
         fallback_url = base_url + path
         links.add(fallback_url)
     
-    return sorted(list(links))
+    result = sorted(links)
+    
+    # Only successful seed fetches are cached so transient failures are retried
+    if seed_fetched:
+        _DISCOVERY_CACHE.pop(seed_url, None)
+        if len(_DISCOVERY_CACHE) >= DISCOVERY_CACHE_SIZE:
+            del _DISCOVERY_CACHE[next(iter(_DISCOVERY_CACHE))]
+        _DISCOVERY_CACHE[seed_url] = (now, result)
+    
+    return list(result)
 
 
 def fetch(url: str, timeout: int = 15) -> requests.Response:
-    headers = {
-        'User-Agent': CRWLR_UA
-    }
+    resp = _SESSION.get(url, timeout=timeout, stream=True)
     
-    resp = requests.get(url, headers=headers, timeout=timeout, stream=True)
+    try:
+        content_length = resp.headers.get('Content-Length')
+        if content_length and int(content_length) > CRWLR_MAX_BYTES:
+            raise ValueError(f"Content-Length {content_length} exceeds max bytes {CRWLR_MAX_BYTES}")
+        
+        resp.raise_for_status()
+        
+        # Content-Length may be absent (chunked) or wrong, so cap the bytes actually read
+        chunks = []
+        total = 0
+        for chunk in resp.iter_content(FETCH_CHUNK_SIZE):
+            total += len(chunk)
+            if total > CRWLR_MAX_BYTES:
+                raise ValueError(f"Response body exceeds max bytes {CRWLR_MAX_BYTES}")
+            chunks.append(chunk)
+        resp._content = b''.join(chunks)
+    finally:
+        resp.close()
     
-    content_length = resp.headers.get('Content-Length')
-    if content_length and int(content_length) > CRWLR_MAX_BYTES:
-        raise ValueError(f"Content-Length {content_length} exceeds max bytes {CRWLR_MAX_BYTES}")
+    return resp
+
+
+async def fetch_async(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    resp = await client.send(client.build_request('GET', url), stream=True)
     
-    resp.raise_for_status()
+    try:
+        content_length = resp.headers.get('Content-Length')
+        if content_length and int(content_length) > CRWLR_MAX_BYTES:
+            raise ValueError(f"Content-Length {content_length} exceeds max bytes {CRWLR_MAX_BYTES}")
+        
+        resp.raise_for_status()
+        
+        chunks = []
+        total = 0
+        async for chunk in resp.aiter_bytes(FETCH_CHUNK_SIZE):
+            total += len(chunk)
+            if total > CRWLR_MAX_BYTES:
+                raise ValueError(f"Response body exceeds max bytes {CRWLR_MAX_BYTES}")
+            chunks.append(chunk)
+        resp._content = b''.join(chunks)
+    finally:
+        await resp.aclose()
     
     return resp
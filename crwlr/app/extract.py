@@ -1,8 +1,28 @@
-from bs4 import BeautifulSoup
+from typing import Optional
+from lxml import html as lxml_html
 from readability import Document
 from .utils import clean_text
 
 
+def parse_html(html: str) -> Optional[lxml_html.HtmlElement]:
+    if not html.strip():
+        return None
+    
+    try:
+        return lxml_html.fromstring(html)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration
+        return lxml_html.fromstring(html.encode('utf-8'))
+
+
+def extract_title(root: Optional[lxml_html.HtmlElement]) -> str:
+    if root is None:
+        return ""
+    
+    title = root.findtext('.//title')
+    return clean_text(title) if title else ""
+
+
 def extract_main_content(html: str) -> str:
     try:
         doc = Document(html)
@@ -11,22 +31,35 @@ def extract_main_content(html: str) -> str:
         return html
 
 
-def sectionize(html: str) -> list[dict]:
-    soup = BeautifulSoup(html, 'lxml')
-    
-    main_elem = soup.find('main')
-    article_elem = soup.find('article')
-    content_id = soup.find(id='content')
-    content_class = soup.find(class_='content')
+HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4'])
+SECTION_TAGS = ('h1', 'h2', 'h3', 'h4', 'p', 'li')
+
+SCOPE_XPATHS = [
+    './/main',
+    './/article',
+    './/*[@id="content"]',
+    './/*[contains(concat(" ", normalize-space(@class), " "), " content ")]',
+]
+
+
+def sectionize(root: Optional[lxml_html.HtmlElement]) -> list[dict]:
+    if root is None:
+        return []
     
-    scope = main_elem or article_elem or content_id or content_class or soup
+    scope = root
+    for xpath in SCOPE_XPATHS:
+        matches = root.xpath(xpath)
+        if matches:
+            scope = matches[0]
+            break
     
     sections = []
     current_heading = ""
     current_text_parts = []
     
-    for element in scope.find_all(['h1', 'h2', 'h3', 'h4', 'p', 'li', 'div']):
-        if element.name in ['h1', 'h2', 'h3', 'h4']:
+    # <div> is skipped: its text is already covered by descendant <p>/<li> elements
+    for element in scope.iter(*SECTION_TAGS):
+        if element.tag in HEADING_TAGS:
             if current_heading or current_text_parts:
                 text = clean_text(' '.join(current_text_parts))
                 if text:
@@ -35,10 +68,10 @@ def sectionize(html: str) -> list[dict]:
                         'text': text
                     })
             
-            current_heading = clean_text(element.get_text())
+            current_heading = clean_text(element.text_content())
             current_text_parts = []
         else:
-            text = element.get_text()
+            text = element.text_content()
             if text.strip():
                 current_text_parts.append(text)
     
@@ -1,17 +1,29 @@
 import sqlite3
-import json
+import orjson
 import time
 import os
 
 
 DB_PATH = os.getenv('CRWLR_DB_PATH', 'crwlr.db')
 
+_CONN = None
+
+
+def _connection() -> sqlite3.Connection:
+    global _CONN
+    
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+        _CONN.execute('PRAGMA journal_mode=WAL')
+        _CONN.execute('PRAGMA synchronous=NORMAL')
+    
+    return _CONN
+
 
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    conn = _connection()
     
-    cursor.execute('''
+    conn.execute('''
         CREATE TABLE IF NOT EXISTS documents (
             url TEXT PRIMARY KEY,
             fetched_at INTEGER,
@@ -20,7 +32,7 @@ def init_db():
         )
     ''')
     
-    cursor.execute('''
+    conn.execute('''
         CREATE TABLE IF NOT EXISTS findings (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             doc_url TEXT,
@@ -31,70 +43,63 @@ def init_db():
         )
     ''')
     
-    conn.commit()
-    conn.close()
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_findings_url ON findings(doc_url)')
 
 
 def store_document(url: str, title: str, raw_length: int):
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
     fetched_at = int(time.time())
     
-    cursor.execute('''
+    _connection().execute('''
         INSERT OR REPLACE INTO documents (url, fetched_at, title, raw_length)
         VALUES (?, ?, ?, ?)
     ''', (url, fetched_at, title, raw_length))
-    
-    conn.commit()
-    conn.close()
 
 
 def store_findings(doc_url: str, findings: list[dict]):
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    conn = _connection()
     
-    cursor.execute('DELETE FROM findings WHERE doc_url = ?', (doc_url,))
-    
-    for finding in findings:
-        cursor.execute('''
+    conn.execute('BEGIN')
+    try:
+        conn.execute('DELETE FROM findings WHERE doc_url = ?', (doc_url,))
+        conn.executemany('''
             INSERT INTO findings (doc_url, heading, text, tags_json)
             VALUES (?, ?, ?, ?)
-        ''', (doc_url, finding['heading'], finding['text'], json.dumps(finding['tags'])))
-    
-    conn.commit()
-    conn.close()
+        ''', [
+            (doc_url, finding['heading'], finding['text'], orjson.dumps(finding['tags']).decode())
+            for finding in findings
+        ])
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')
 
 
 def get_cached_result(url: str) -> dict | None:
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT title FROM documents WHERE url = ?', (url,))
-    row = cursor.fetchone()
-    
-    if not row:
-        conn.close()
+    rows = _connection().execute('''
+        SELECT d.title, f.heading, f.text, f.tags_json
+        FROM documents d
+        LEFT JOIN findings f ON f.doc_url = d.url
+        WHERE d.url = ?
+        ORDER BY f.id
+    ''', (url,)).fetchall()
+    
+    if not rows:
         return None
     
-    title = row[0]
-    
-    cursor.execute('SELECT heading, text, tags_json FROM findings WHERE doc_url = ?', (url,))
-    findings_rows = cursor.fetchall()
+    title = rows[0][0]
     
     findings = []
-    for heading, text, tags_json in findings_rows:
-        tags = json.loads(tags_json)
-        snippet = text[:500] if len(text) > 500 else text
+    for _, heading, text, tags_json in rows:
+        if tags_json is None:
+            continue
+        tags = orjson.loads(tags_json)
         findings.append({
             'heading': heading,
             'text': text,
-            'snippet': snippet,
+            'snippet': text[:500],
             'tags': tags
         })
     
-    conn.close()
-    
     return {
         'url': url,
         'title': title,
@@ -1,12 +1,14 @@
 import re
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 import tldextract
 
 
+_POLICY_KW = re.compile(r'privacy|terms|policy|legal|conditions|tos', re.IGNORECASE)
+
+
 def is_probable_policy_path(path: str) -> bool:
-    keywords = ['privacy', 'terms', 'policy', 'legal', 'conditions', 'tos']
-    path_lower = path.lower()
-    return any(keyword in path_lower for keyword in keywords)
+    return _POLICY_KW.search(path) is not None
 
 
 def absolutize(base: str, href: str) -> str:
@@ -18,11 +20,15 @@ def clean_text(s: str) -> str:
     return s.strip()
 
 
+@lru_cache(maxsize=8192)
+def _registrable(host: str) -> str:
+    ext = tldextract.extract(host)
+    return f"{ext.domain}.{ext.suffix}" if ext.suffix else ext.domain
+
+
+def registrable_domain(url: str) -> str:
+    return _registrable(urlparse(url).hostname or url)
+
+
 def same_registrable_domain(a: str, b: str) -> bool:
-    ext_a = tldextract.extract(a)
-    ext_b = tldextract.extract(b)
-    
-    domain_a = f"{ext_a.domain}.{ext_a.suffix}" if ext_a.suffix else ext_a.domain
-    domain_b = f"{ext_b.domain}.{ext_b.suffix}" if ext_b.suffix else ext_b.domain
-    
-    return domain_a == domain_b
+    return registrable_domain(a) == registrable_domain(b)
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+from app import crawler
 from app.utils import same_registrable_domain
 from app.crawler import discover_policy_links
 
@@ -18,3 +20,38 @@ def test_fallbacks_included():
     assert 'https://example.com/terms-of-service' in links
     assert 'https://example.com/legal/terms' in links
     assert 'https://example.com/legal/privacy' in links
+
+
+def test_discovery_cached_per_seed(monkeypatch):
+    calls = []
+    
+    def fake_fetch(url, timeout=15):
+        calls.append(url)
+        return SimpleNamespace(content=b'<a href="/legal/cookies">Cookies</a><a href="/blog">Blog</a>')
+    
+    monkeypatch.setattr(crawler, 'fetch', fake_fetch)
+    monkeypatch.setattr(crawler, '_DISCOVERY_CACHE', {})
+    
+    first = discover_policy_links('https://cached.example.com')
+    second = discover_policy_links('https://cached.example.com')
+    
+    assert first == second
+    assert 'https://cached.example.com/legal/cookies' in first
+    assert 'https://cached.example.com/blog' not in first
+    assert calls == ['https://cached.example.com']
+
+
+def test_discovery_failure_not_cached(monkeypatch):
+    calls = []
+    
+    def failing_fetch(url, timeout=15):
+        calls.append(url)
+        raise ValueError("boom")
+    
+    monkeypatch.setattr(crawler, 'fetch', failing_fetch)
+    monkeypatch.setattr(crawler, '_DISCOVERY_CACHE', {})
+    
+    discover_policy_links('https://down.example.com')
+    discover_policy_links('https://down.example.com')
+    
+    assert len(calls) == 2
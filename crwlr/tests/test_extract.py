@@ -0,0 +1,54 @@
+from pathlib import Path
+from app.extract import parse_html, extract_title, extract_main_content, sectionize
+
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+def test_sectionize_headings():
+    html = (FIXTURES / 'sample_privacy_min.html').read_text()
+    sections = sectionize(parse_html(extract_main_content(html)))
+    
+    assert [s['heading'] for s in sections] == [
+        'Data Collection',
+        'Cookies and Tracking',
+        "Children's Privacy"
+    ]
+
+
+def test_sectionize_no_duplicated_text():
+    html = (FIXTURES / 'sample_privacy_chrome.html').read_text()
+    sections = sectionize(parse_html(extract_main_content(html)))
+    
+    texts = [s['text'] for s in sections]
+    for text in texts:
+        assert sum(text in other for other in texts) == 1
+
+
+def test_sectionize_empty():
+    assert sectionize(parse_html('')) == []
+    assert sectionize(parse_html('   ')) == []
+
+
+def test_extract_title():
+    html = (FIXTURES / 'sample_privacy_min.html').read_text()
+    
+    assert extract_title(parse_html(html)) == 'Privacy Policy'
+    assert extract_title(parse_html('<p>No title</p>')) == ''
+    assert extract_title(parse_html('')) == ''
+
+
+def test_sectionize_nested_wrappers():
+    html = (
+        '<main><div><div><div>'
+        '<h2>Cookies</h2><div><p>We use cookies.</p></div>'
+        '</div></div></div></main>'
+    )
+    
+    assert sectionize(parse_html(html)) == [{'heading': 'Cookies', 'text': 'We use cookies.'}]
+
+
+def test_parse_html_encoding_declaration():
+    html = '<?xml version="1.0" encoding="utf-8"?><html><head><title>Terms</title></head></html>'
+    
+    assert extract_title(parse_html(html)) == 'Terms'
@@ -0,0 +1,35 @@
+import asyncio
+import httpx
+import pytest
+from app import crawler
+
+
+def _run_fetch(handler):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await crawler.fetch_async(client, 'https://example.com/privacy')
+    
+    return asyncio.run(run())
+
+
+async def _chunks(count: int, size: int):
+    for _ in range(count):
+        yield b'a' * size
+
+
+def test_fetch_async_reads_body():
+    resp = _run_fetch(lambda request: httpx.Response(200, html='<title>Privacy</title>'))
+    
+    assert resp.text == '<title>Privacy</title>'
+
+
+def test_fetch_async_caps_chunked_body(monkeypatch):
+    monkeypatch.setattr(crawler, 'CRWLR_MAX_BYTES', 1000)
+    
+    with pytest.raises(ValueError):
+        _run_fetch(lambda request: httpx.Response(200, content=_chunks(4, 500)))
+
+
+def test_fetch_async_raises_for_status():
+    with pytest.raises(httpx.HTTPStatusError):
+        _run_fetch(lambda request: httpx.Response(404))
@@ -1,4 +1,6 @@
-from app.analyze import tag_section
+import re
+from app import analyze
+from app.analyze import tag_section, analyze_sections
 
 
 def test_data_sale_rule():
@@ -45,6 +47,14 @@ def test_children_rule():
     assert any(tag['severity'] == 'high' for tag in tags if tag['id'] == 'children')
 
 
+def test_overlapping_rules_all_fire():
+    text = "We may sell tracking cookies and location information we retain as data."
+    tags = tag_section(text, ['base'])
+    
+    ids = [tag['id'] for tag in tags]
+    assert ids == ['data_sale', 'tracking', 'location', 'retention']
+
+
 def test_snippet_length():
     long_text = "a" * 1000
     tags = tag_section(long_text + " cookie tracking data", ['base'])
@@ -52,3 +62,47 @@ def test_snippet_length():
     if tags:
         snippet = long_text[:500]
         assert len(snippet) <= 500
+
+
+def test_analyze_sections_snippet():
+    long_text = "We use cookies. " + "a" * 1000
+    findings = analyze_sections([
+        {'heading': 'Long', 'text': long_text},
+        {'heading': 'Short', 'text': "We use cookies."},
+        {'heading': 'None', 'text': "Nothing to see here."}
+    ], ['base'])
+    
+    assert [f['heading'] for f in findings] == ['Long', 'Short']
+    assert findings[0]['snippet'] == long_text[:500]
+    assert findings[1]['snippet'] == "We use cookies."
+
+
+def test_rule_keywords_cover_regex_matches():
+    texts = [
+        "We may sell your personal data to third parties.",
+        "You agree to arbitration for any disputes arising from this agreement.",
+        "You waive any right to join a class action.",
+        "We use cookies and tracking pixels to improve your experience.",
+        "We collect your location data to provide personalized services.",
+        "GPS information helps us improve routing.",
+        "We retain your personal information for up to 7 years.",
+        "Records we store are deleted after a year.",
+        "Our service is not intended for children under 13 years of age.",
+        "Nothing to see here."
+    ]
+    
+    for rule in analyze.RULE_PACKS['base']:
+        keywords = re.compile('|'.join(rule['keywords']), re.IGNORECASE)
+        for text in texts:
+            if re.search(rule['regex'], text, re.IGNORECASE):
+                assert keywords.search(text), (rule['id'], text)
+
+
+def test_stdlib_fallback_matches_rule_set(monkeypatch):
+    text = "We may sell tracking cookies and location information we retain as data."
+    expected = tag_section(text, ['base'])
+    
+    monkeypatch.setitem(analyze.RULE_SETS, 'base', None)
+    
+    assert tag_section(text, ['base']) == expected
+    assert tag_section("Nothing to see here.", ['base']) == []
@@ -0,0 +1,56 @@
+import pytest
+from app import storage
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, 'DB_PATH', str(tmp_path / 'crwlr.db'))
+    monkeypatch.setattr(storage, '_CONN', None)
+    storage.init_db()
+    yield
+    storage._CONN.close()
+
+
+def test_cached_result_roundtrip(db):
+    storage.store_document('https://example.com/privacy', 'Privacy', 1234)
+    storage.store_findings('https://example.com/privacy', [
+        {'heading': 'Cookies', 'text': 'We use cookies.', 'tags': [{'id': 'tracking'}]}
+    ])
+    
+    result = storage.get_cached_result('https://example.com/privacy')
+    
+    assert result['title'] == 'Privacy'
+    assert result['cached'] is True
+    assert result['findings'] == [{
+        'heading': 'Cookies',
+        'text': 'We use cookies.',
+        'snippet': 'We use cookies.',
+        'tags': [{'id': 'tracking'}]
+    }]
+
+
+def test_store_findings_replaces_previous(db):
+    storage.store_document('https://example.com/terms', 'Terms', 10)
+    storage.store_findings('https://example.com/terms', [
+        {'heading': 'A', 'text': 'old', 'tags': []}
+    ])
+    storage.store_findings('https://example.com/terms', [
+        {'heading': 'B', 'text': 'new', 'tags': []}
+    ])
+    
+    result = storage.get_cached_result('https://example.com/terms')
+    
+    assert [f['heading'] for f in result['findings']] == ['B']
+
+
+def test_cache_miss(db):
+    assert storage.get_cached_result('https://example.com/missing') is None
+
+
+def test_cached_result_without_findings(db):
+    storage.store_document('https://example.com/legal', 'Legal', 10)
+    
+    result = storage.get_cached_result('https://example.com/legal')
+    
+    assert result['title'] == 'Legal'
+    assert result['findings'] == []
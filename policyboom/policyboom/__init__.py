@@ -6,6 +6,13 @@ Analyze Terms of Service and Privacy Policies with multi-domain scanning.
 
 __version__ = "0.1.0"
 
-from .scanner import scan
+__all__ = ["scan", "scan_many", "__version__"]
 
-__all__ = ["scan", "__version__"]
+
+def __getattr__(name):
+    # Import the scanner on first use of policyboom.scan: it loads httpx,
+    # tldextract and the OpenAI client, which `policyboom --help` never needs
+    if name in ("scan", "scan_many"):
+        from . import scanner
+        return getattr(scanner, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
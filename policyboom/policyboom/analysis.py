@@ -1,19 +1,202 @@
 """Severity analysis and category tagging engine."""
 
 import re
+import string
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from .models import Clause, Finding, Severity, Category
 from .utils import generate_text_fragment_url
 from typing import Optional
 
+try:
+    import re2
+except ImportError:  # google-re2 is optional; fall back to the stdlib engine
+    re2 = None
+
+
+_WS_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\S+')
+_ASCII_FOLD = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+if re2 is not None:
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.case_sensitive = False
+    # Bounded gaps expand into large programs; the default 8 MiB budget leaves
+    # the combined alternation's DFA short of memory and RE2 falls back to NFA
+    _RE2_OPTIONS.max_mem = 32 << 20
+
+
+def _compile_rule(pattern: str, folded_input: bool = False):
+    """
+    Compile a case-insensitive rule pattern, preferring RE2's linear-time engine.
+    
+    Rule patterns are written in lowercase, so when the caller casefolds the
+    text itself (folded_input) the stdlib pattern skips IGNORECASE, which
+    otherwise roughly doubles the cost of every scan.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, _RE2_OPTIONS)
+        except re2.error:
+            pass
+    return re.compile(pattern, 0 if folded_input else re.IGNORECASE)
+
+
+def _fold_case(text: str) -> str:
+    """Lowercase text for the stdlib engine without shifting any character offsets."""
+    folded = text.casefold()
+    if len(folded) == len(text):
+        return folded
+    # A few characters (e.g. 'ß') fold to several; the rules only need ASCII folded
+    return text.translate(_ASCII_FOLD)
+
 
 class RulePattern:
     """A single analysis rule pattern."""
     
-    def __init__(self, category: Category, severity: Severity, pattern: str, label: str):
+    def __init__(
+        self,
+        category: Category,
+        severity: Severity,
+        pattern: str,
+        label: str,
+        keywords: tuple[str, ...]
+    ):
         self.category = category
         self.severity = severity
-        self.pattern = re.compile(pattern, re.IGNORECASE)
+        self.pattern_src = pattern
+        self.pattern = _compile_rule(pattern)
         self.label = label
+        # Lowercase literals, at least one of which occurs in every match
+        self.keywords = keywords
+
+
+# Rules sharing a category stay separate entries: each yields its own finding
+# and label. They are already merged for matching purposes by the combined
+# alternation below, so folding them into one pattern would only drop findings.
+_RULES: list[RulePattern] = [
+    RulePattern(
+        Category.ARBITRATION,
+        Severity.HIGH,
+        r'(arbitration|waive.{0,80}?class action|waive.{0,80}?jury trial|binding arbitration)',
+        'Forced arbitration or class action waiver',
+        ('arbitration', 'waive')
+    ),
+    RulePattern(
+        Category.DATA_SALE,
+        Severity.HIGH,
+        r'(sell.{0,80}?information|monetize.{0,80}?data|share.{0,80}?third.{0,20}parties'
+        r'|disclose.{0,80}?data.{0,80}?partners)',
+        'Data sale or third-party sharing',
+        ('sell', 'monetize', 'share', 'disclose')
+    ),
+    RulePattern(
+        Category.TRACKING,
+        Severity.MEDIUM,
+        r'(track|cookies|web beacon|pixel|analytics|advertising.{0,80}?identifier)',
+        'Tracking and advertising technology',
+        ('track', 'cookies', 'web beacon', 'pixel', 'analytics', 'advertising')
+    ),
+    RulePattern(
+        Category.LOCATION,
+        Severity.MEDIUM,
+        r'(location.{0,80}?data|geolocation|gps|precise.{0,80}?location)',
+        'Location data collection',
+        ('location', 'gps')
+    ),
+    RulePattern(
+        Category.RETENTION,
+        Severity.MEDIUM,
+        r'(retain.{0,80}?data|keep.{0,80}?information|storage.{0,80}?period|data.{0,80}?retention)',
+        'Data retention policy',
+        ('retain', 'keep', 'storage', 'retention')
+    ),
+    RulePattern(
+        Category.CHILDREN_DATA,
+        Severity.HIGH,
+        r'(children.{0,80}?data|coppa|under.{0,80}?13|minors.{0,80}?information|parental consent)',
+        "Children's data handling (COPPA)",
+        ('children', 'coppa', 'under', 'minors', 'parental consent')
+    ),
+    RulePattern(
+        Category.DATA_SALE,
+        Severity.HIGH,
+        r'(without.{0,80}?notice|without.{0,80}?consent).{0,80}?(?:data|information)',
+        'Data use without consent',
+        ('without',)
+    ),
+    RulePattern(
+        Category.ARBITRATION,
+        Severity.HIGH,
+        r'(cannot.{0,80}?sue|may not.{0,80}?bring.{0,80}?claim|waive.{0,80}?right.{0,80}?court)',
+        'Litigation rights waiver',
+        ('cannot', 'may not', 'waive')
+    ),
+    RulePattern(
+        Category.TRACKING,
+        Severity.LOW,
+        r'(google.{0,80}?analytics|facebook.{0,80}?pixel|third.{0,10}party.{0,80}?analytics)',
+        'Third-party analytics',
+        ('analytics', 'pixel')
+    ),
+]
+
+_ALL_RULE_INDEXES = frozenset(range(len(_RULES)))
+
+
+def _build_keyword_index(rules: list[RulePattern]) -> dict[str, frozenset[int]]:
+    """Map each rule keyword to the indexes of the rules it can anchor."""
+    index = {}
+    for rule_index, rule in enumerate(rules):
+        for keyword in rule.keywords:
+            index[keyword] = index.get(keyword, frozenset()) | {rule_index}
+    return index
+
+
+_KEYWORD_RULES = _build_keyword_index(_RULES)
+
+
+@lru_cache(maxsize=512)
+def _combined_pattern(rule_indexes: frozenset[int]):
+    """Compile one alternation over the given rules, naming each branch r<index>."""
+    return _compile_rule(
+        '|'.join(f'(?P<r{i}>{_RULES[i].pattern_src})' for i in sorted(rule_indexes)),
+        folded_input=re2 is None
+    )
+
+
+# Every clause starts with the full alternation, so build it at import time
+# alongside the rule patterns rather than inside the first analyze_clause call
+_combined_pattern(_ALL_RULE_INDEXES)
+
+
+def _first_matches(text: str) -> dict:
+    """
+    Find the first match of every rule in one pass per hit.
+    
+    The combined pattern reports the leftmost match among the remaining rules,
+    which is exactly that rule's own first match; the rule is then dropped so
+    matches overlapping it are still found for the others.
+    """
+    if re2 is None:
+        # The stdlib engine retries every rule at every offset, so first narrow
+        # down to rules whose literal keywords occur at all; most clauses have none
+        text = _fold_case(text)
+        remaining = frozenset().union(
+            *(indexes for keyword, indexes in _KEYWORD_RULES.items() if keyword in text)
+        )
+    else:
+        remaining = _ALL_RULE_INDEXES
+    
+    matches = {}
+    while remaining:
+        match = _combined_pattern(remaining).search(text)
+        if match is None:
+            break
+        index = int(match.lastgroup[1:])
+        matches[index] = match
+        remaining = remaining - {index}
+    return matches
 
 
 class Analysis:
@@ -21,68 +204,7 @@ class Analysis:
     
     def __init__(self):
         """Initialize analysis engine with rule patterns."""
-        self.rules = self._load_rules()
-    
-    def _load_rules(self) -> list[RulePattern]:
-        """Load analysis rule patterns."""
-        rules = [
-            RulePattern(
-                Category.ARBITRATION,
-                Severity.HIGH,
-                r'(arbitration|waive.*class action|waive.*jury trial|binding arbitration)',
-                'Forced arbitration or class action waiver'
-            ),
-            RulePattern(
-                Category.DATA_SALE,
-                Severity.HIGH,
-                r'(sell.*information|monetize.*data|share.*third.{0,20}parties|disclose.*data.*partners)',
-                'Data sale or third-party sharing'
-            ),
-            RulePattern(
-                Category.TRACKING,
-                Severity.MEDIUM,
-                r'(track|cookies|web beacon|pixel|analytics|advertising.*identifier)',
-                'Tracking and advertising technology'
-            ),
-            RulePattern(
-                Category.LOCATION,
-                Severity.MEDIUM,
-                r'(location.*data|geolocation|gps|precise.*location)',
-                'Location data collection'
-            ),
-            RulePattern(
-                Category.RETENTION,
-                Severity.MEDIUM,
-                r'(retain.*data|keep.*information|storage.*period|data.*retention)',
-                'Data retention policy'
-            ),
-            RulePattern(
-                Category.CHILDREN_DATA,
-                Severity.HIGH,
-                r'(children.*data|coppa|under.*13|minors.*information|parental consent)',
-                "Children's data handling (COPPA)"
-            ),
-            RulePattern(
-                Category.DATA_SALE,
-                Severity.HIGH,
-                r'(without.*notice|without.*consent).*(?:data|information)',
-                'Data use without consent'
-            ),
-            RulePattern(
-                Category.ARBITRATION,
-                Severity.HIGH,
-                r'(cannot.*sue|may not.*bring.*claim|waive.*right.*court)',
-                'Litigation rights waiver'
-            ),
-            RulePattern(
-                Category.TRACKING,
-                Severity.LOW,
-                r'(google.*analytics|facebook.*pixel|third.{0,10}party.*analytics)',
-                'Third-party analytics'
-            ),
-        ]
-        
-        return rules
+        self.rules = _RULES
     
     def analyze_clause(self, clause: Clause) -> list[Finding]:
         """
@@ -97,73 +219,70 @@ class Analysis:
         if clause.ai_category and clause.ai_severity:
             return self._create_ai_finding(clause)
         
-        # Otherwise, use regex-based analysis
-        text_lower = clause.text.lower()
-        
-        for rule in self.rules:
-            match = rule.pattern.search(text_lower)
-            if match:
-                snippet = self._extract_snippet(clause.text, match.start(), match.end())
-                
-                # Generate text fragment URL using just the matched text
-                # Simpler approach: use the actual matched text from the clause
-                import re as snippet_re
-                
-                # Normalize whitespace in the entire clause first
-                normalized_text = snippet_re.sub(r'\s+', ' ', clause.text)
-                
-                # Find the match in the normalized text (case-insensitive search)
-                normalized_match = rule.pattern.search(normalized_text.lower())
-                if normalized_match:
-                    # Extract just the matched portion (preserves original case)
-                    matched_text = normalized_text[normalized_match.start():normalized_match.end()]
-                    
-                    # Use the matched text as the fragment (browsers are good at finding short exact matches)
-                    unique_snippet = matched_text.strip()
-                else:
-                    # Fallback: use first 10 words
-                    unique_snippet = ' '.join(normalized_text.split()[:10])
-                
-                fragment_url = generate_text_fragment_url(clause.document_url, unique_snippet)
-                
-                finding = Finding(
-                    clause_id=clause.id,
-                    category=rule.category,
-                    severity=rule.severity,
-                    text=clause.text,
-                    snippet=snippet,
-                    section_title=clause.section_title,
-                    document_url=fragment_url,
-                    matched_pattern=rule.label,
-                    document_type=clause.document_type,
-                    full_text=clause.text,
-                    context_before=clause.context_before,
-                    context_after=clause.context_after,
-                    last_updated=clause.last_updated
-                )
-                
-                findings.append(finding)
+        # Word offsets are shared by every rule that fires on this clause
+        words = None
+        
+        matches = _first_matches(clause.text)
+        
+        for index in sorted(matches):
+            rule = self.rules[index]
+            match = matches[index]
+            if words is None:
+                words, word_starts, word_ends = self._word_offsets(clause.text)
+            
+            snippet = self._extract_snippet(clause.text, match.start(), match.end())
+            
+            # Generate text fragment URL from the whole words spanned by the match
+            # (preserves original case; browsers only match fragments on word boundaries)
+            first_word = bisect_right(word_ends, match.start())
+            last_word = bisect_left(word_starts, match.end())
+            unique_snippet = ' '.join(words[first_word:last_word])
+            
+            fragment_url = generate_text_fragment_url(clause.document_url, unique_snippet)
+            
+            finding = Finding(
+                clause_id=clause.id,
+                category=rule.category,
+                severity=rule.severity,
+                text=clause.text,
+                snippet=snippet,
+                section_title=clause.section_title,
+                document_url=fragment_url,
+                matched_pattern=rule.label,
+                document_type=clause.document_type,
+                full_text=clause.text,
+                context_before=clause.context_before,
+                context_after=clause.context_after,
+                last_updated=clause.last_updated
+            )
+            
+            findings.append(finding)
         
         return findings
     
+    def _word_offsets(self, text: str) -> tuple[list[str], list[int], list[int]]:
+        """Split text into words with their start and end offsets."""
+        words = []
+        starts = []
+        ends = []
+        for word in _WORD_RE.finditer(text):
+            words.append(word.group())
+            starts.append(word.start())
+            ends.append(word.end())
+        return words, starts, ends
+    
     def _extract_snippet(self, text: str, start: int, end: int, context: int = 100) -> str:
         """Extract a snippet of text around a match."""
         snippet_start = max(0, start - context)
         snippet_end = min(len(text), end + context)
         
-        snippet = text[snippet_start:snippet_end]
-        
-        if snippet_start > 0:
-            snippet = '...' + snippet
-        if snippet_end < len(text):
-            snippet = snippet + '...'
+        prefix = '...' if snippet_start > 0 else ''
+        suffix = '...' if snippet_end < len(text) else ''
         
-        return snippet.strip()
+        return f"{prefix}{text[snippet_start:snippet_end]}{suffix}".strip()
     
     def _create_ai_finding(self, clause: Clause) -> list[Finding]:
         """Create finding from AI-extracted clause metadata."""
-        import re
-        
         # Map AI category to our Category enum
         category_map = {
             "dataSale": Category.DATA_SALE,
@@ -192,7 +311,7 @@ class Analysis:
         
         # Use exact clause text as fragment (AI extracted it correctly)
         # Normalize whitespace first
-        normalized_text = re.sub(r'\s+', ' ', clause.text.strip())
+        normalized_text = _WS_RE.sub(' ', clause.text.strip())
         
         # Use first 10 words for fragment to ensure it matches page
         words = normalized_text.split()[:10]
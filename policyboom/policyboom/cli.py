@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
 """PolicyBoom CLI - Command-line interface for policy analysis."""
 
-import ast
-import re
+import csv
+import json
+import logging
+import sys
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.markdown import Markdown
-from policyboom import scan, __version__
+from policyboom import __version__
+from policyboom.database import Database
 
 
 console = Console()
@@ -28,7 +28,11 @@ def main(ctx):
         policyboom exec "scan('slack.com').summarizeHigh()"
         policyboom exec "scan('stripe.com').summarizeHigh().category('arbitration')"
     """
+    _configure_logging()
+    
     if ctx.invoked_subcommand is None:
+        from rich.panel import Panel
+        
         console.print(Panel.fit(
             "[bold cyan]PolicyBoom 💥[/bold cyan]\n\n"
             "Enterprise Legal Risk Intelligence CLI\n\n"
@@ -170,6 +174,8 @@ Click any Source URL to see the clause in its original context!
 For more help: `policyboom --help`
 """
     
+    from rich.markdown import Markdown
+    
     console.print(Markdown(guide_text))
 
 
@@ -263,6 +269,8 @@ policyboom exec "scan('company.com').summarizeHigh().category('childrenData')"
 ```
 """
     
+    from rich.markdown import Markdown
+    
     console.print(Markdown(examples_text))
 
 
@@ -285,7 +293,6 @@ def export(scan_id: str, format: str, output: str):
         output = f"scan_{scan_id[:8]}.{format}"
     
     try:
-        from policyboom.database import Database
         db = Database()
         
         scan_obj = db.get_scan(scan_id)
@@ -293,44 +300,28 @@ def export(scan_id: str, format: str, output: str):
             console.print(f"[red]❌ Scan not found:[/red] {scan_id}")
             return
         
-        findings = db.get_findings(scan_id)
+        # Rows stream straight from SQLite into the file
+        findings = db.iter_findings(scan_id)
         
         if format == 'json':
-            import json
-            data = {
-                'scan_id': scan_obj.id,
-                'domain': scan_obj.domain,
-                'created_at': scan_obj.created_at.isoformat(),
-                'findings_count': len(findings),
-                'findings': [
-                    {
-                        'clause_id': f.clause_id,
-                        'category': f.category.value,
-                        'severity': f.severity.value,
-                        'section_title': f.section_title,
-                        'snippet': f.snippet,
-                        'document_url': f.document_url,
-                    }
-                    for f in findings
-                ]
-            }
             with open(output, 'w') as f:
-                json.dump(data, f, indent=2)
+                _write_json_export(f, scan_obj, findings, db.count_findings(scan_id))
         
         elif format == 'csv':
-            import csv
-            with open(output, 'w', newline='') as f:
+            with open(output, 'w', newline='', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 writer.writerow(['Clause ID', 'Category', 'Severity', 'Section', 'Snippet', 'URL'])
-                for finding in findings:
-                    writer.writerow([
+                writer.writerows(
+                    (
                         finding.clause_id,
                         finding.category.value,
                         finding.severity.value,
                         finding.section_title,
                         finding.snippet[:100],
                         finding.document_url,
-                    ])
+                    )
+                    for finding in findings
+                )
         
         console.print(f"[green]✅ Exported to:[/green] {output}")
         
@@ -340,6 +331,57 @@ def export(scan_id: str, format: str, output: str):
         console.print(f"[red]❌ Export failed:[/red] {e}")
 
 
+def _write_json_export(fp, scan_obj, findings, findings_count: int):
+    """
+    Stream a scan export as indented JSON, one finding at a time.
+    
+    Produces the same document as json.dump(..., indent=2) on the full export
+    dict without building it in memory first.
+    """
+    header = {
+        'scan_id': scan_obj.id,
+        'domain': scan_obj.domain,
+        'created_at': scan_obj.created_at.isoformat(),
+        'findings_count': findings_count,
+    }
+    fp.write('{')
+    for key, value in header.items():
+        fp.write(f'\n  {json.dumps(key)}: {json.dumps(value)},')
+    fp.write('\n  "findings": [')
+    
+    written = 0
+    for finding in findings:
+        record = json.dumps({
+            'clause_id': finding.clause_id,
+            'category': finding.category.value,
+            'severity': finding.severity.value,
+            'section_title': finding.section_title,
+            'snippet': finding.snippet,
+            'document_url': finding.document_url,
+        }, indent=2)
+        fp.write((',\n    ' if written else '\n    ') + record.replace('\n', '\n    '))
+        written += 1
+    
+    fp.write('\n  ]\n}' if written else ']\n}')
+
+
+def _configure_logging():
+    """
+    Print policyboom's progress messages as plain lines on stdout.
+    
+    Only the package's own logger is configured; httpx and the OpenAI
+    client log every request at INFO, which would bury the progress lines.
+    """
+    log = logging.getLogger("policyboom")
+    if log.handlers:
+        return
+    
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+
+
 def _safe_eval_scan_expression(expression: str):
     """
     Safely evaluate scan expression using simple parsing.
@@ -348,15 +390,15 @@ def _safe_eval_scan_expression(expression: str):
     if not expression.strip().startswith('scan('):
         raise ValueError("Expression must start with scan('domain.com')")
     
-    domain_match = re.search(r"scan\(['\"]([^'\"]+)['\"]\)", expression)
-    if not domain_match:
-        raise ValueError("Could not extract domain from scan() call")
+    domain, chain_start = _extract_scan_domain(expression)
     
-    domain = domain_match.group(1)
+    # The scanner pulls in the HTTP, extraction and LLM client stacks, so only
+    # commands that actually scan pay for importing it
+    from policyboom.scanner import scan
     
     result = scan(domain)
     
-    chain = _extract_method_chain_from_expression(expression)
+    chain = _extract_method_chain_from_expression(expression, chain_start)
     
     for method_name, args in chain:
         if method_name == 'summarizeHigh':
@@ -384,31 +426,65 @@ def _safe_eval_scan_expression(expression: str):
     return result
 
 
-def _extract_method_chain_from_expression(expression: str) -> list[tuple[str, list]]:
-    """Extract method chain from expression string."""
-    import re
+def _extract_scan_domain(expression: str) -> tuple[str, int]:
+    """
+    Find the first scan('domain') call in the expression.
     
-    methods = []
+    Returns the domain and the offset just past the call's closing parenthesis.
+    """
+    start = expression.find('scan(')
+    while start != -1:
+        quote = start + 5
+        if quote < len(expression) and expression[quote] in '\'"':
+            end = quote + 1
+            while end < len(expression) and expression[end] not in '\'"':
+                end += 1
+            if end > quote + 1 and expression[end + 1:end + 2] == ')':
+                return expression[quote + 1:end], end + 2
+        start = expression.find('scan(', start + 1)
     
-    pattern = r'\.(\w+)\(([^)]*)\)'
-    matches = re.finditer(pattern, expression)
+    raise ValueError("Could not extract domain from scan() call")
+
+
+def _extract_method_chain_from_expression(
+    expression: str,
+    start: int = 0
+) -> list[tuple[str, list]]:
+    """Extract .method(args) calls from expression string, scanning from start."""
+    methods = []
     
-    for match in matches:
-        method_name = match.group(1)
-        args_str = match.group(2).strip()
+    dot = expression.find('.', start)
+    while dot != -1:
+        name_end = dot + 1
+        while name_end < len(expression) and (
+            expression[name_end].isalnum() or expression[name_end] == '_'
+        ):
+            name_end += 1
         
-        args = []
-        if args_str:
-            args_str = args_str.strip('\'"')
-            args.append(args_str)
+        if name_end > dot + 1 and expression[name_end:name_end + 1] == '(':
+            close = expression.find(')', name_end + 1)
+            if close != -1:
+                method_name = expression[dot + 1:name_end]
+                args_str = expression[name_end + 1:close].strip()
+                
+                args = []
+                if args_str:
+                    args_str = args_str.strip('\'"')
+                    args.append(args_str)
+                
+                methods.append((method_name, args))
+                dot = expression.find('.', close + 1)
+                continue
         
-        methods.append((method_name, args))
+        dot = expression.find('.', dot + 1)
     
     return methods
 
 
 def _print_metadata(metadata: dict):
     """Print metadata in a formatted table."""
+    from rich.table import Table
+    
     console.print(f"\n[cyan]Scan Metadata:[/cyan]\n")
     
     table = Table(show_header=True, header_style="bold cyan")
@@ -2,17 +2,69 @@
 
 import sqlite3
 import json
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 from .models import Scan, Document, Clause, Finding, Severity, Category
 
 
+# Plain dict lookups skip EnumMeta.__call__ when rebuilding findings row by row
+_CATEGORIES = {category.value: category for category in Category}
+_SEVERITIES = {severity.value: severity for severity in Severity}
+
+# Bump whenever _init_schema or _migrate_schema changes
+SCHEMA_VERSION = 4
+
+# How long a recorded URL probe outcome is trusted by discovery
+URL_PROBE_TTL = 24 * 60 * 60
+
+# Write statements live at module level so every call hands sqlite3 the same
+# string object and its statement cache returns the already-compiled statement
+_INSERT_SCAN_SQL = """
+    INSERT OR REPLACE INTO scans (id, domain, created_at, status, metadata)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_INSERT_DOC_SQL = """
+    INSERT INTO documents (scan_id, url, doc_type, title, last_updated)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_INSERT_CLAUSE_SQL = """
+    INSERT OR REPLACE INTO clauses 
+    (id, document_id, text, section_title, paragraph_index, document_url,
+     document_type, last_updated, context_before, context_after)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_FINDING_SQL = """
+    INSERT INTO findings 
+    (clause_id, scan_id, category, severity, text, snippet, 
+     section_title, document_url, matched_pattern, document_type,
+     full_text, context_before, context_after, last_updated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_URL_PROBE_SQL = """
+    INSERT OR REPLACE INTO url_probe_cache (host, path, status, probed_at)
+    VALUES (?, ?, ?, ?)
+"""
+
+
 class Database:
     """Local SQLite database for caching scans."""
     
-    def __init__(self, db_path: Optional[str] = None):
-        """Initialize database connection."""
+    def __init__(self, db_path: Optional[str] = None, store_clauses: bool = True):
+        """
+        Initialize database connection.
+        
+        Finding rows carry their own copy of the clause text and context, so
+        reports never read the clauses table; store_clauses=False skips
+        writing it for findings-only runs.
+        """
         if db_path is None:
             home = Path.home()
             db_dir = home / ".policyboom"
@@ -20,90 +72,192 @@ class Database:
             db_path = str(db_dir / "scans.db")
         
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
-        self.conn.row_factory = sqlite3.Row
+        self.store_clauses = store_clauses
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._writer_conn = None
+        self._write_lock = threading.Lock()
         self._init_schema()
     
-    def _init_schema(self):
-        """Initialize database schema."""
-        cursor = self.conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS scans (
-                id TEXT PRIMARY KEY,
-                domain TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                status TEXT NOT NULL,
-                metadata TEXT
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS documents (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                scan_id TEXT NOT NULL,
-                url TEXT NOT NULL,
-                doc_type TEXT,
-                title TEXT,
-                last_updated TEXT,
-                FOREIGN KEY (scan_id) REFERENCES scans(id)
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS clauses (
-                id TEXT PRIMARY KEY,
-                document_id INTEGER NOT NULL,
-                text TEXT NOT NULL,
-                section_title TEXT,
-                paragraph_index INTEGER,
-                document_url TEXT,
-                document_type TEXT,
-                last_updated TEXT,
-                context_before TEXT,
-                context_after TEXT,
-                FOREIGN KEY (document_id) REFERENCES documents(id)
-            )
-        """)
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """
+        The calling thread's read connection, opened on first use.
         
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS findings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                clause_id TEXT NOT NULL,
-                scan_id TEXT NOT NULL,
-                category TEXT NOT NULL,
-                severity TEXT NOT NULL,
-                text TEXT NOT NULL,
-                snippet TEXT,
-                section_title TEXT,
-                document_url TEXT,
-                matched_pattern TEXT,
-                document_type TEXT,
-                paragraph_number INTEGER,
-                full_text TEXT,
-                context_before TEXT,
-                context_after TEXT,
-                last_updated TEXT,
-                FOREIGN KEY (clause_id) REFERENCES clauses(id),
-                FOREIGN KEY (scan_id) REFERENCES scans(id)
-            )
-        """)
+        Each thread reads through its own connection, while every write goes
+        through the single writer connection held by _transaction; SQLite only
+        admits one writer at a time anyway, and WAL lets readers run alongside
+        it. An in-memory database exists only inside its connection, so that
+        case keeps a single connection shared by every thread.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            if self.db_path == ":memory:" and self._connections:
+                conn = self._connections[0]
+            else:
+                conn = self._connect()
+            self._local.conn = conn
+        return conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection settings applied."""
+        # Autocommit on the Python side: transactions are opened explicitly by
+        # _transaction, so single statements never sit in an implicit one
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_scans_domain ON scans(domain)
-        """)
+        # WAL with synchronous=NORMAL only fsyncs at checkpoints; the rest keeps
+        # temp b-trees and up to 64 MiB of pages in memory, maps the file for
+        # reads, and waits out another connection's write lock instead of failing
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=5000")
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_findings_severity ON findings(severity)
-        """)
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+    
+    @contextmanager
+    def _transaction(self):
+        """
+        Run the enclosed writes in one BEGIN/COMMIT on the writer connection.
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_findings_category ON findings(category)
-        """)
+        Writers queue on a lock rather than contending for SQLite's write lock
+        through busy_timeout retries. Rolls back on error.
+        """
+        with self._write_lock:
+            if self._writer_conn is None:
+                self._writer_conn = self.conn if self.db_path == ":memory:" else self._connect()
+            conn = self._writer_conn
+            
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
+    def _init_schema(self):
+        """
+        Initialize database schema.
         
-        self._migrate_schema(cursor)
+        A database already stamped with SCHEMA_VERSION is up to date, so the
+        DDL and column migrations only run when the version is behind.
+        """
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            return
         
-        self.conn.commit()
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS scans (
+                    id TEXT PRIMARY KEY,
+                    domain TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    metadata TEXT
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    scan_id TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    doc_type TEXT,
+                    title TEXT,
+                    last_updated TEXT,
+                    FOREIGN KEY (scan_id) REFERENCES scans(id)
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS clauses (
+                    id TEXT PRIMARY KEY,
+                    document_id INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    section_title TEXT,
+                    paragraph_index INTEGER,
+                    document_url TEXT,
+                    document_type TEXT,
+                    last_updated TEXT,
+                    context_before TEXT,
+                    context_after TEXT,
+                    FOREIGN KEY (document_id) REFERENCES documents(id)
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS findings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    clause_id TEXT NOT NULL,
+                    scan_id TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    severity TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    snippet TEXT,
+                    section_title TEXT,
+                    document_url TEXT,
+                    matched_pattern TEXT,
+                    document_type TEXT,
+                    paragraph_number INTEGER,
+                    full_text TEXT,
+                    context_before TEXT,
+                    context_after TEXT,
+                    last_updated TEXT,
+                    FOREIGN KEY (clause_id) REFERENCES clauses(id),
+                    FOREIGN KEY (scan_id) REFERENCES scans(id)
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_scans_domain ON scans(domain)
+            """)
+            
+            # get_findings always filters on scan_id and optionally severity and/or
+            # category; the composite index serves every combination, which made the
+            # old single-column severity/category indexes redundant
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_findings_scan_sev_cat
+                ON findings(scan_id, severity, category)
+            """)
+            
+            cursor.execute("DROP INDEX IF EXISTS idx_findings_severity")
+            cursor.execute("DROP INDEX IF EXISTS idx_findings_category")
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_documents_scan ON documents(scan_id)
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_clauses_doc ON clauses(document_id)
+            """)
+            
+            # Outcomes of discovery's HEAD/GET probes, reused across scans
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS url_probe_cache (
+                    host TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    status INTEGER NOT NULL,
+                    probed_at INTEGER NOT NULL,
+                    PRIMARY KEY (host, path)
+                )
+            """)
+            
+            self._migrate_schema(cursor)
+            
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     
     def _migrate_schema(self, cursor):
         """Add new columns to existing tables if they don't exist."""
@@ -138,29 +292,84 @@ class Database:
     
     def save_scan(self, scan: Scan):
         """Save a scan to the database."""
-        cursor = self.conn.cursor()
+        with self._transaction() as conn:
+            self._insert_scan(conn, scan)
+    
+    def save_scan_results(self, scan: Scan, results: list[tuple[Document, list[Finding]]]):
+        """
+        Save a scan with every (document, findings) pair from it in one transaction.
+        
+        The whole scan costs a single commit, and the scan's status only
+        changes together with the rows it describes.
+        """
+        with self._transaction() as conn:
+            for document, findings in results:
+                doc_id = self._insert_document(conn, scan.id, document)
+                if self.store_clauses:
+                    self._insert_clauses(conn, doc_id, document.clauses)
+                self._insert_findings(conn, scan.id, findings)
+            self._insert_scan(conn, scan)
+    
+    def save_document(self, scan_id: str, document: Document) -> int:
+        """Save a document and return its ID."""
+        with self._transaction() as conn:
+            return self._insert_document(conn, scan_id, document)
+    
+    def save_document_results(
+        self,
+        scan_id: str,
+        document: Document,
+        findings: list[Finding]
+    ) -> int:
+        """Save a document with its clauses and findings in one transaction; return its ID."""
+        with self._transaction() as conn:
+            doc_id = self._insert_document(conn, scan_id, document)
+            if self.store_clauses:
+                self._insert_clauses(conn, doc_id, document.clauses)
+            self._insert_findings(conn, scan_id, findings)
+        return doc_id
+    
+    def save_clause(self, document_id: int, clause: Clause):
+        """Save a clause to the database with full evidence."""
+        self.save_clauses_bulk(document_id, [clause])
+    
+    def save_clauses_bulk(self, document_id: int, clauses: list[Clause]):
+        """Save a document's clauses in a single transaction."""
+        if not self.store_clauses:
+            return
         
-        cursor.execute("""
-            INSERT OR REPLACE INTO scans (id, domain, created_at, status, metadata)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
+        with self._transaction() as conn:
+            self._insert_clauses(conn, document_id, clauses)
+    
+    def save_finding(self, scan_id: str, finding: Finding):
+        """Save a finding to the database with full evidence and metadata."""
+        self.save_findings_bulk(scan_id, [finding])
+    
+    def save_findings_bulk(self, scan_id: str, findings: list[Finding]):
+        """Save a batch of findings in a single transaction."""
+        with self._transaction() as conn:
+            self._insert_findings(conn, scan_id, findings)
+    
+    def _insert_scan(self, conn: sqlite3.Connection, scan: Scan):
+        """Insert or replace a scan row on conn."""
+        conn.execute(_INSERT_SCAN_SQL, (
             scan.id,
             scan.domain,
             scan.created_at.isoformat(),
             scan.status,
             json.dumps({})
         ))
-        
-        self.conn.commit()
     
-    def save_document(self, scan_id: str, document: Document) -> int:
-        """Save a document and return its ID."""
-        cursor = self.conn.cursor()
+    def _insert_document(
+        self,
+        conn: sqlite3.Connection,
+        scan_id: str,
+        document: Document
+    ) -> int:
+        """Insert a document row in the writer's open transaction and return its ID."""
+        cursor = conn.cursor()
         
-        cursor.execute("""
-            INSERT INTO documents (scan_id, url, doc_type, title, last_updated)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(_INSERT_DOC_SQL, (
             scan_id,
             document.url,
             document.doc_type,
@@ -168,64 +377,64 @@ class Database:
             document.last_updated
         ))
         
-        self.conn.commit()
         doc_id = cursor.lastrowid
         if doc_id is None:
             raise ValueError("Failed to save document")
         return doc_id
     
-    def save_clause(self, document_id: int, clause: Clause):
-        """Save a clause to the database with full evidence."""
-        cursor = self.conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO clauses 
-            (id, document_id, text, section_title, paragraph_index, document_url,
-             document_type, last_updated, context_before, context_after)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            clause.id,
-            document_id,
-            clause.text,
-            clause.section_title,
-            clause.paragraph_index,
-            clause.document_url,
-            clause.document_type,
-            clause.last_updated,
-            clause.context_before,
-            clause.context_after
+    def _insert_clauses(self, conn: sqlite3.Connection, document_id: int, clauses: list[Clause]):
+        """Insert clause rows in the writer's open transaction."""
+        conn.executemany(_INSERT_CLAUSE_SQL, (
+            (
+                clause.id,
+                document_id,
+                clause.text,
+                clause.section_title,
+                clause.paragraph_index,
+                clause.document_url,
+                clause.document_type,
+                clause.last_updated,
+                clause.context_before,
+                clause.context_after
+            )
+            for clause in clauses
         ))
-        
-        self.conn.commit()
     
-    def save_finding(self, scan_id: str, finding: Finding):
-        """Save a finding to the database with full evidence and metadata."""
-        cursor = self.conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO findings 
-            (clause_id, scan_id, category, severity, text, snippet, 
-             section_title, document_url, matched_pattern, document_type,
-             full_text, context_before, context_after, last_updated)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            finding.clause_id,
-            scan_id,
-            finding.category.value,
-            finding.severity.value,
-            finding.text,
-            finding.snippet,
-            finding.section_title,
-            finding.document_url,
-            finding.matched_pattern,
-            finding.document_type,
-            finding.full_text,
-            finding.context_before,
-            finding.context_after,
-            finding.last_updated
+    def _insert_findings(self, conn: sqlite3.Connection, scan_id: str, findings: list[Finding]):
+        """Insert finding rows in the writer's open transaction."""
+        conn.executemany(_INSERT_FINDING_SQL, (
+            (
+                finding.clause_id,
+                scan_id,
+                finding.category.value,
+                finding.severity.value,
+                finding.text,
+                finding.snippet,
+                finding.section_title,
+                finding.document_url,
+                finding.matched_pattern,
+                finding.document_type,
+                finding.full_text,
+                finding.context_before,
+                finding.context_after,
+                finding.last_updated
+            )
+            for finding in findings
         ))
+    
+    def get_url_probe(self, host: str, path: str, max_age: int = URL_PROBE_TTL) -> Optional[int]:
+        """Return the status recorded for a probed URL within max_age seconds, if any."""
+        row = self.conn.execute(
+            "SELECT status FROM url_probe_cache WHERE host = ? AND path = ? AND probed_at > ?",
+            (host, path, int(time.time()) - max_age)
+        ).fetchone()
         
-        self.conn.commit()
+        return row[0] if row else None
+    
+    def save_url_probe(self, host: str, path: str, status: int):
+        """Record the status a URL probe returned."""
+        with self._transaction() as conn:
+            conn.execute(_UPSERT_URL_PROBE_SQL, (host, path, status, int(time.time())))
     
     def get_scan(self, scan_id: str) -> Optional[Scan]:
         """Retrieve a scan by ID."""
@@ -253,9 +462,29 @@ class Database:
         category: Optional[Category] = None
     ) -> list[Finding]:
         """Retrieve findings for a scan with optional filters, including all evidence."""
+        return list(self.iter_findings(scan_id, severity, category))
+    
+    def iter_findings(
+        self,
+        scan_id: str,
+        severity: Optional[Severity] = None,
+        category: Optional[Category] = None
+    ) -> Iterator[Finding]:
+        """
+        Yield findings for a scan as rows stream from SQLite, without buffering them.
+        
+        Reads the findings table alone; every field a report needs is stored on
+        the finding row, so no join to clauses or documents is involved.
+        """
         cursor = self.conn.cursor()
         
-        query = "SELECT * FROM findings WHERE scan_id = ?"
+        # Columns in Finding's field order so each row unpacks straight into it
+        query = """
+            SELECT clause_id, category, severity, text, snippet, section_title,
+                   document_url, matched_pattern, document_type, full_text,
+                   context_before, context_after, last_updated
+            FROM findings WHERE scan_id = ?
+        """
         params = [scan_id]
         
         if severity:
@@ -266,29 +495,46 @@ class Database:
             query += " AND category = ?"
             params.append(category.value)
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        # Keep insertion order now that rows come back through the index
+        query += " ORDER BY id"
         
-        findings = []
-        for row in rows:
-            findings.append(Finding(
-                clause_id=row['clause_id'],
-                category=Category(row['category']),
-                severity=Severity(row['severity']),
-                text=row['text'],
-                snippet=row['snippet'],
-                section_title=row['section_title'],
-                document_url=row['document_url'],
-                matched_pattern=row['matched_pattern'],
-                document_type=row['document_type'] or "Unknown",
-                full_text=row['full_text'] or row['text'],
-                context_before=row['context_before'] or "",
-                context_after=row['context_after'] or "",
-                last_updated=row['last_updated']
-            ))
+        cursor.execute(query, params)
         
-        return findings
+        for (
+            clause_id, category_value, severity_value, text, snippet, section_title,
+            document_url, matched_pattern, document_type, full_text,
+            context_before, context_after, last_updated
+        ) in cursor:
+            yield Finding(
+                clause_id,
+                _CATEGORIES[category_value],
+                _SEVERITIES[severity_value],
+                text,
+                snippet,
+                section_title,
+                document_url,
+                matched_pattern,
+                document_type or "Unknown",
+                full_text or text,
+                context_before or "",
+                context_after or "",
+                last_updated
+            )
+    
+    def count_findings(self, scan_id: str) -> int:
+        """Count the findings stored for a scan."""
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM findings WHERE scan_id = ?", (scan_id,)
+        ).fetchone()
+        return row[0]
     
     def close(self):
-        """Close database connection."""
-        self.conn.close()
+        """Close every connection opened by this database."""
+        with self._connections_lock:
+            for conn in self._connections:
+                # Refresh planner statistics for the indexes this session used
+                conn.execute("PRAGMA optimize")
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+        self._writer_conn = None
@@ -1,14 +1,22 @@
 """Multi-domain and subdomain discovery engine."""
 
+import asyncio
 import httpx
-from bs4 import BeautifulSoup
 import tldextract
-import time
+import re
 import random
-from typing import Set
-from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from typing import Optional, Set
+from urllib.parse import urldefrag, urljoin, urlparse, urlsplit
 
 from .user_agents import get_headers
+from .database import Database
+from .utils import parse_html, create_async_http_client, create_http_client, run_sync
+
+
+# Public Suffix List lookups repeat for every anchor on a page and across pages
+# of the same site; ExtractResult is an immutable tuple, so results are shareable
+_extract_domain = lru_cache(maxsize=1024)(tldextract.extract)
 
 
 class Discovery:
@@ -19,6 +27,28 @@ class Discovery:
         'tos', 'service', 'conditions', 'eula', 'gdpr', 'ccpa'
     ]
     
+    # Zero-width lookahead so findall reports every keyword occurrence, even
+    # where two keywords overlap; a set of the results is the keywords present
+    _KEYWORD_RE = re.compile(
+        '(?=(' + '|'.join(map(re.escape, POLICY_KEYWORDS)) + '))', re.IGNORECASE
+    )
+    
+    # Every document-type hint in one pass; when a URL carries several,
+    # _classify_document_type applies them in DOC_TYPE_PRIORITY order
+    _DOC_TYPE_RE = re.compile(
+        r'(?=(?P<privacy>privacy)|(?P<terms>terms|tos)|(?P<cookie>cookie)'
+        r'|(?P<eula>eula)|(?P<aup>acceptable|aup))',
+        re.IGNORECASE
+    )
+    
+    DOC_TYPE_PRIORITY = [
+        ('privacy', 'Privacy Policy'),
+        ('terms', 'Terms of Service'),
+        ('cookie', 'Cookie Policy'),
+        ('eula', 'EULA'),
+        ('aup', 'Acceptable Use Policy'),
+    ]
+    
     # Optimized: Most common paths first, removed rarely-used ones
     COMMON_PATHS = [
         '/privacy',
@@ -28,13 +58,26 @@ class Discovery:
         '/terms-of-service',
     ]
     
-    def __init__(self, timeout: int = 15, max_docs: int = 10, max_valid_docs: int = 3):
-        """Initialize discovery engine."""
+    # Candidate URLs validated concurrently; jitter still applies per request
+    MAX_CONCURRENT_PROBES = 8
+    
+    def __init__(self, timeout: int = 15, max_docs: int = 10, max_valid_docs: int = 3,
+                 client: Optional[httpx.Client] = None, db: Optional[Database] = None):
+        """
+        Initialize discovery engine.
+        
+        Pass a shared client to reuse its connections; it is then left open
+        by close() for its owner to close. With a db, probe outcomes are
+        recorded there and reused by later scans until they expire.
+        """
         self.timeout = timeout
         self.max_docs = max_docs
         self.max_valid_docs = max_valid_docs  # Stop after finding this many valid docs
-        self.client = httpx.Client(timeout=timeout, follow_redirects=True)
+        self._owns_client = client is None
+        self.client = client or create_http_client(timeout)
+        self.db = db
         self.failed_urls = set()  # Cache failed URLs
+        self.dead_hosts: set[str] = set()  # Hosts that refused or never answered a connection
     
     def discover(self, seed_url: str) -> list[dict]:
         """
@@ -47,7 +90,6 @@ class Discovery:
         
         discovered = set()
         policy_urls = []
-        valid_count = 0
         
         try:
             response = self.client.get(seed_url, headers=get_headers())
@@ -59,25 +101,18 @@ class Discovery:
             fallback_urls = self._generate_fallback_urls(seed_url)
             discovered.update(fallback_urls)
             
-            # Validate URLs with HEAD requests and stop early
-            for url in list(discovered)[:self.max_docs]:
-                # Skip if we already found enough valid documents
-                if valid_count >= self.max_valid_docs:
-                    break
-                
-                # Add random delay (1-3 seconds) to mimic human behavior
-                time.sleep(random.uniform(1.0, 3.0))
-                
-                # Check if URL exists before adding
-                if self._url_exists(url):
-                    doc_type = self._classify_document_type(url)
-                    confidence = self._calculate_confidence(url)
-                    policy_urls.append({
-                        'url': url,
-                        'doc_type': doc_type,
-                        'confidence': confidence
-                    })
-                    valid_count += 1
+            # Validate URLs with concurrent HEAD requests and stop early
+            candidates = list(discovered)[:self.max_docs]
+            valid_urls = run_sync(self._validate_urls(candidates))
+            
+            for url in valid_urls:
+                doc_type = self._classify_document_type(url)
+                confidence = self._calculate_confidence(url)
+                policy_urls.append({
+                    'url': url,
+                    'doc_type': doc_type,
+                    'confidence': confidence
+                })
         
         except Exception as e:
             print(f"Discovery error for {seed_url}: {e}")
@@ -89,16 +124,28 @@ class Discovery:
         links = set()
         
         try:
-            soup = BeautifulSoup(html, 'lxml')
-            base_domain = tldextract.extract(base_url)
+            root = parse_html(html)
+            base_ext = _extract_domain(base_url)
+            
+            # Unless the base URL itself carries a policy keyword, the joined URL
+            # can only get one from the href, so most anchors are rejected here
+            # before paying for urljoin and the suffix lookup
+            check_href = not self._is_probable_policy_url(base_url)
             
-            for anchor in soup.find_all('a', href=True):
-                href = anchor.get('href', '')
+            for anchor in root.iter('a'):
+                href = anchor.get('href')
+                if href is None:
+                    continue
+                if check_href and not self._is_probable_policy_url(href):
+                    continue
                 absolute_url = urljoin(base_url, href)
                 
-                if self._is_same_registrable_domain(absolute_url, base_url):
+                ext = _extract_domain(absolute_url)
+                if ext.domain == base_ext.domain and ext.suffix == base_ext.suffix:
                     if self._is_probable_policy_url(absolute_url):
-                        links.add(absolute_url)
+                        # The fragment never reaches the server, so /privacy and
+                        # /privacy#cookies are one page to probe and extract
+                        links.add(urldefrag(absolute_url).url)
         
         except Exception:
             pass
@@ -111,7 +158,7 @@ class Discovery:
         base = f"{parsed.scheme}://{parsed.netloc}"
         
         # Extract domain parts for mobile variants
-        ext = tldextract.extract(base_url)
+        ext = _extract_domain(base_url)
         domain = ext.domain
         suffix = ext.suffix
         
@@ -139,31 +186,22 @@ class Discovery:
     
     def _is_same_registrable_domain(self, url1: str, url2: str) -> bool:
         """Check if two URLs share the same registrable domain."""
-        ext1 = tldextract.extract(url1)
-        ext2 = tldextract.extract(url2)
+        ext1 = _extract_domain(url1)
+        ext2 = _extract_domain(url2)
         return (ext1.domain == ext2.domain and ext1.suffix == ext2.suffix)
     
     def _is_probable_policy_url(self, url: str) -> bool:
         """Check if URL likely contains policy content."""
-        url_lower = url.lower()
-        return any(keyword in url_lower for keyword in self.POLICY_KEYWORDS)
+        return self._KEYWORD_RE.search(url) is not None
     
     def _classify_document_type(self, url: str) -> str:
         """Classify document type based on URL."""
-        url_lower = url.lower()
+        found = {match.lastgroup for match in self._DOC_TYPE_RE.finditer(url)}
         
-        if 'privacy' in url_lower:
-            return 'Privacy Policy'
-        elif 'terms' in url_lower or 'tos' in url_lower:
-            return 'Terms of Service'
-        elif 'cookie' in url_lower:
-            return 'Cookie Policy'
-        elif 'eula' in url_lower:
-            return 'EULA'
-        elif 'acceptable' in url_lower or 'aup' in url_lower:
-            return 'Acceptable Use Policy'
-        else:
-            return 'Legal Document'
+        for group, doc_type in self.DOC_TYPE_PRIORITY:
+            if group in found:
+                return doc_type
+        return 'Legal Document'
     
     def _calculate_confidence(self, url: str) -> float:
         """Calculate confidence score for URL."""
@@ -173,47 +211,121 @@ class Discovery:
         if '/privacy' in url_lower or '/terms' in url_lower:
             score += 0.3
         
-        keyword_count = sum(1 for kw in self.POLICY_KEYWORDS if kw in url_lower)
+        keyword_count = len({kw.lower() for kw in self._KEYWORD_RE.findall(url)})
         score += min(keyword_count * 0.1, 0.2)
         
         return min(score, 1.0)
     
-    def _url_exists(self, url: str) -> bool:
+    async def _validate_urls(self, candidates: list[str]) -> list[str]:
+        """
+        Probe candidate URLs concurrently and return up to max_valid_docs that exist.
+        
+        Results keep the candidates' order. Once enough URLs have validated the
+        remaining probes are cancelled.
+        """
+        if not candidates or self.max_valid_docs <= 0:
+            return []
+        
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PROBES)
+        valid = set()
+        
+        async with create_async_http_client(self.timeout, self.MAX_CONCURRENT_PROBES) as client:
+            async def probe(url: str) -> tuple[str, bool]:
+                # A recorded outcome needs neither a request nor the jitter delay
+                cached = self._cached_probe(url)
+                if cached is not None:
+                    return url, cached
+                
+                async with semaphore:
+                    # Add random delay (1-3 seconds) to mimic human behavior
+                    await asyncio.sleep(random.uniform(1.0, 3.0))
+                    return url, await self._url_exists(client, url)
+            
+            tasks = [asyncio.create_task(probe(url)) for url in candidates]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    url, exists = await next_done
+                    if exists:
+                        valid.add(url)
+                        if len(valid) >= self.max_valid_docs:
+                            break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return [url for url in candidates if url in valid]
+    
+    async def _url_exists(self, client: httpx.AsyncClient, url: str) -> bool:
         """
         Check if URL exists using HEAD request with GET fallback.
         
         Returns True for 2xx and 3xx responses, False for 404/errors.
-        Caches only true failures (404, network errors) to avoid retries.
+        Caches only true failures (404, network errors) to avoid retries;
+        _validate_urls consults the recorded probes before calling this.
         """
-        if url in self.failed_urls:
+        host = urlparse(url).netloc
+        if url in self.failed_urls or host in self.dead_hosts:
             return False
         
         try:
             # Try HEAD request first (lightweight) with random user-agent
-            response = self.client.head(url, timeout=5, headers=get_headers())
+            response = await client.head(url, timeout=5, headers=get_headers())
             
             # Accept 2xx and 3xx status codes
             if 200 <= response.status_code < 400:
+                self._remember_probe(url, response.status_code)
                 return True
             
-            # If HEAD not allowed (405/501), fallback to GET with minimal download
+            # If HEAD not allowed (405/501), fallback to GET
             if response.status_code in (405, 501):
-                # Try GET request but limit download with new headers
-                response = self.client.get(url, timeout=5, headers=get_headers())
+                response = await client.get(url, timeout=5, headers=get_headers())
                 if 200 <= response.status_code < 400:
+                    self._remember_probe(url, response.status_code)
                     return True
             
-            # True failures: 404, 403, 500, etc.
+            # True failures: 404, 410
             if response.status_code in (404, 410):
                 self.failed_urls.add(url)
+                self._remember_probe(url, response.status_code)
             
             return False
         
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            # DNS failures and refused connections hit every path on the host,
+            # e.g. a nonexistent m. subdomain, so skip the host from now on
+            self.dead_hosts.add(host)
+            return False
+        
         except Exception:
-            # Network errors, timeouts, DNS failures - mark as failed
+            # Network errors, timeouts - mark as failed
             self.failed_urls.add(url)
             return False
     
+    def _probe_key(self, url: str) -> tuple[str, str]:
+        """Split a URL into the (host, path) key of the probe cache; path keeps the query."""
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        return parts.netloc, path
+    
+    def _cached_probe(self, url: str) -> Optional[bool]:
+        """Return whether a still-fresh recorded probe found the URL, or None if unknown."""
+        if self.db is None:
+            return None
+        
+        status = self.db.get_url_probe(*self._probe_key(url))
+        if status is None:
+            return None
+        return 200 <= status < 400
+    
+    def _remember_probe(self, url: str, status: int):
+        """Record a definitive probe outcome (found, or 404/410) for later scans."""
+        if self.db is not None:
+            self.db.save_url_probe(*self._probe_key(url), status)
+    
     def close(self):
         """Close HTTP client."""
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
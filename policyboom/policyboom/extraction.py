@@ -1,23 +1,57 @@
 """Clause extraction engine."""
 
+import asyncio
 import httpx
-from bs4 import BeautifulSoup
 from readability import Document as ReadabilityDoc
+from readability.readability import shorten_title
 import hashlib
 import re
 from .models import Clause, Document
+from .utils import parse_html, strip_scripts, element_text, create_http_client, run_sync
 from datetime import datetime
 from typing import Optional
 
 
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# "Last updated"-style dates, tried in order; compiled once rather than per page
+_DATE_PATTERNS = [
+    re.compile(r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*([A-Za-z]+ \d{1,2},? \d{4})', re.IGNORECASE),
+    re.compile(r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*(\d{1,2}/\d{1,2}/\d{4})', re.IGNORECASE),
+    re.compile(r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*(\d{4}-\d{2}-\d{2})', re.IGNORECASE),
+]
+
+# Site-wide placeholders that say nothing about the document; readability
+# gets a chance to find something better
+_GENERIC_TITLES = frozenset(['home', 'homepage', 'index', 'untitled', 'welcome'])
+
+
 class Extraction:
     """Extracts clauses from legal documents."""
     
-    def __init__(self, timeout: int = 15, max_bytes: int = 1_000_000):
-        """Initialize extraction engine."""
+    CHUNK_SIZE = 65536
+    
+    # Documents fetched and parsed at once by extract_documents
+    MAX_CONCURRENT_DOCUMENTS = 8
+    
+    HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4'])
+    SECTION_TAGS = ('h1', 'h2', 'h3', 'h4', 'p', 'li')
+    
+    # Content types worth parsing; images, PDFs and other binaries are skipped
+    TEXT_CONTENT_TYPES = ('html', 'xml', 'text/')
+    
+    def __init__(self, timeout: int = 15, max_bytes: int = 1_000_000,
+                 client: Optional[httpx.Client] = None):
+        """
+        Initialize extraction engine.
+        
+        Pass a shared client to reuse its connections; it is then left open
+        by close() for its owner to close.
+        """
         self.timeout = timeout
         self.max_bytes = max_bytes
-        self.client = httpx.Client(timeout=timeout, follow_redirects=True)
+        self._owns_client = client is None
+        self.client = client or create_http_client(timeout)
     
     def extract_document(self, url: str, doc_type: str) -> Optional[Document]:
         """
@@ -26,18 +60,19 @@ class Extraction:
         Returns Document with clauses or None if extraction fails.
         """
         try:
-            response = self.client.get(url)
-            response.raise_for_status()
-            
-            if len(response.content) > self.max_bytes:
+            html = self._fetch_html(url)
+            if html is None:
                 return None
             
-            html = response.text
+            # Parsed once for title, date and the fallback clause pass;
+            # readability parses its own copy because summary() mutates it
+            root = parse_html(html)
+            strip_scripts(root)
             
-            title = self._extract_title(html)
-            last_updated = self._extract_last_updated(html)
+            title = self._extract_title(root)
+            last_updated = self._extract_last_updated(root)
             
-            clauses = self._extract_clauses(html, url, doc_type, last_updated)
+            clauses = self._extract_clauses(html, root, url, doc_type, last_updated)
             
             document = Document(
                 url=url,
@@ -53,38 +88,81 @@ class Extraction:
             print(f"Extraction error for {url}: {e}")
             return None
     
-    def _extract_title(self, html: str) -> str:
+    def extract_documents(self, items: list[tuple[str, str]]) -> list[Optional[Document]]:
+        """
+        Extract several (url, doc_type) documents concurrently.
+        
+        Each extract_document call runs in a worker thread, so page fetches
+        overlap on the shared client. Results follow the order of items.
+        """
+        if not items:
+            return []
+        
+        return run_sync(self._extract_documents(items))
+    
+    async def _extract_documents(self, items: list[tuple[str, str]]) -> list[Optional[Document]]:
+        """Run extract_document for each item, at most MAX_CONCURRENT_DOCUMENTS at a time."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DOCUMENTS)
+        
+        async def extract(url: str, doc_type: str) -> Optional[Document]:
+            async with semaphore:
+                return await asyncio.to_thread(self.extract_document, url, doc_type)
+        
+        return await asyncio.gather(*(extract(url, doc_type) for url, doc_type in items))
+    
+    def _fetch_html(self, url: str) -> Optional[str]:
+        """
+        Download a page body, giving up as soon as it exceeds max_bytes.
+        
+        Returns None for oversized or non-text responses without reading
+        (or while reading) more of the body than necessary.
+        """
+        with self.client.stream("GET", url) as response:
+            response.raise_for_status()
+            
+            content_type = response.headers.get("content-type", "").lower()
+            if content_type and not any(kind in content_type for kind in self.TEXT_CONTENT_TYPES):
+                return None
+            
+            content_length = response.headers.get("content-length", "")
+            if content_length.isdigit() and int(content_length) > self.max_bytes:
+                return None
+            
+            body = bytearray()
+            for chunk in response.iter_bytes(chunk_size=self.CHUNK_SIZE):
+                body += chunk
+                if len(body) > self.max_bytes:
+                    return None
+            
+            return body.decode(response.encoding or "utf-8", errors="replace")
+    
+    def _extract_title(self, root) -> str:
         """Extract document title."""
+        # A plain <title> tag is the common case on legal pages
+        title_tag = next(root.iter('title'), None)
+        if title_tag is not None:
+            title = ' '.join(title_tag.text_content().split())
+            if title and title.lower() not in _GENERIC_TITLES:
+                return title
+        
         try:
-            doc = ReadabilityDoc(html)
-            return doc.short_title()
+            # Readability's title heuristic, run on the tree we already hold
+            return shorten_title(root)
         except:
-            try:
-                soup = BeautifulSoup(html, 'lxml')
-                title_tag = soup.find('title')
-                if title_tag:
-                    return title_tag.get_text(strip=True)
-                h1 = soup.find('h1')
-                if h1:
-                    return h1.get_text(strip=True)
-            except:
-                pass
+            if title_tag is not None:
+                return element_text(title_tag, separator='')
+            h1 = next(root.iter('h1'), None)
+            if h1 is not None:
+                return element_text(h1, separator='')
         return "Untitled Document"
     
-    def _extract_last_updated(self, html: str) -> Optional[str]:
+    def _extract_last_updated(self, root) -> Optional[str]:
         """Extract 'last updated' or 'effective date' from policy."""
         try:
-            soup = BeautifulSoup(html, 'lxml')
-            text = soup.get_text()
-            
-            patterns = [
-                r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*([A-Za-z]+ \d{1,2},? \d{4})',
-                r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*(\d{1,2}/\d{1,2}/\d{4})',
-                r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*(\d{4}-\d{2}-\d{2})',
-            ]
+            text = root.text_content()
             
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for pattern in _DATE_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     return match.group(1)
             
@@ -92,17 +170,16 @@ class Extraction:
         except:
             return None
     
-    def _extract_clauses(self, html: str, url: str, doc_type: str, last_updated: Optional[str]) -> list[Clause]:
+    def _extract_clauses(self, html: str, root, url: str, doc_type: str, last_updated: Optional[str]) -> list[Clause]:
         """Extract individual clauses from HTML with full context."""
         clauses = []
+        url_hasher = self._clause_id_hasher(url)
         
         try:
             doc = ReadabilityDoc(html)
             content_html = doc.summary()
             
-            soup = BeautifulSoup(content_html, 'lxml')
-            
-            sections = self._sectionize(soup)
+            sections = self._sectionize(parse_html(content_html))
             
             paragraph_index = 0
             for section in sections:
@@ -118,7 +195,7 @@ class Extraction:
                     if len(para_text.strip()) < 50:
                         continue
                     
-                    clause_id = self._generate_clause_id(url, paragraph_index, para_text)
+                    clause_id = self._generate_clause_id(url_hasher, paragraph_index, para_text)
                     
                     context_before = paragraphs[i-1] if i > 0 else ""
                     context_after = paragraphs[i+1] if i < len(paragraphs) - 1 else ""
@@ -140,22 +217,21 @@ class Extraction:
         
         except Exception as e:
             print(f"Clause extraction error: {e}")
-            soup = BeautifulSoup(html, 'lxml')
-            paragraphs = soup.find_all(['p', 'li'])
+            paragraphs = list(root.iter('p', 'li'))
             
             for idx, para in enumerate(paragraphs[:100]):
-                # Use separator=' ' to preserve spaces between inline elements
-                text = para.get_text(separator=' ', strip=True)
+                # Join with ' ' to preserve spaces between inline elements
+                text = element_text(para)
                 if len(text) > 50:
-                    clause_id = self._generate_clause_id(url, idx, text)
+                    clause_id = self._generate_clause_id(url_hasher, idx, text)
                     
                     context_before = ""
                     context_after = ""
                     if idx > 0:
-                        prev_para = paragraphs[idx-1].get_text(separator=' ', strip=True)
+                        prev_para = element_text(paragraphs[idx-1])
                         context_before = prev_para if len(prev_para) > 20 else ""
                     if idx < len(paragraphs) - 1:
-                        next_para = paragraphs[idx+1].get_text(separator=' ', strip=True)
+                        next_para = element_text(paragraphs[idx+1])
                         context_after = next_para if len(next_para) > 20 else ""
                     
                     clause = Clause(
@@ -173,25 +249,25 @@ class Extraction:
         
         return clauses
     
-    def _sectionize(self, soup: BeautifulSoup) -> list[dict]:
+    def _sectionize(self, root) -> list[dict]:
         """Break content into sections based on headings."""
         sections = []
         current_heading = "General"
         current_texts = []
         
-        for element in soup.descendants:
-            if element.name in ['h1', 'h2', 'h3', 'h4']:
+        for element in root.iter(*self.SECTION_TAGS):
+            if element.tag in self.HEADING_TAGS:
                 if current_texts:
                     sections.append({
                         'heading': current_heading,
                         'text': ' '.join(current_texts)
                     })
                     current_texts = []
-                current_heading = element.get_text(strip=True)
+                current_heading = element_text(element, separator='')
             
-            elif element.name in ['p', 'li']:
-                # Use separator=' ' to preserve spaces between inline elements like <strong>, <em>, etc.
-                text = element.get_text(separator=' ', strip=True)
+            else:
+                # Join text nodes with ' ' to preserve spaces between inline elements like <strong>, <em>, etc.
+                text = element_text(element)
                 if text:
                     current_texts.append(text)
         
@@ -205,28 +281,45 @@ class Extraction:
     
     def _split_into_paragraphs(self, text: str) -> list[str]:
         """Split text into logical paragraphs."""
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         
         paragraphs = []
         current = []
+        # Length of ' '.join(current), kept as a running total so each sentence
+        # costs O(1) instead of re-joining the whole paragraph to measure it
+        current_len = -1
         
         for sentence in sentences:
             current.append(sentence)
-            if len(' '.join(current)) > 200:
+            current_len += len(sentence) + 1
+            if current_len > 200:
                 paragraphs.append(' '.join(current))
                 current = []
+                current_len = -1
         
         if current:
             paragraphs.append(' '.join(current))
         
         return paragraphs
     
-    def _generate_clause_id(self, url: str, index: int, text: str) -> str:
-        """Generate unique clause ID."""
-        content = f"{url}:{index}:{text[:100]}"
-        hash_obj = hashlib.sha256(content.encode())
-        return f"clause_{hash_obj.hexdigest()[:12]}"
+    def _clause_id_hasher(self, url: str):
+        """
+        Hash the per-document "{url}:" prefix of every clause ID once.
+        
+        _generate_clause_id copies this state instead of rehashing the URL
+        for each clause.
+        """
+        # A content address, not a security boundary: blake2b is cheaper than
+        # sha256 and emits exactly the 12 hex chars kept
+        return hashlib.blake2b(f"{url}:".encode(), digest_size=6, usedforsecurity=False)
+    
+    def _generate_clause_id(self, url_hasher, index: int, text: str) -> str:
+        """Generate unique clause ID from the document's _clause_id_hasher."""
+        hash_obj = url_hasher.copy()
+        hash_obj.update(f"{index}:{text[:100]}".encode())
+        return f"clause_{hash_obj.hexdigest()}"
     
     def close(self):
         """Close HTTP client."""
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
@@ -1,42 +1,217 @@
 """AI-powered document extraction using Together AI with OpenAI SDK."""
 
 import os
+import asyncio
 import httpx
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional
-from openai import OpenAI
+import openai
+from openai import OpenAI, AsyncOpenAI
 from .models import Document, Clause
+from .llm_cache import LLMCache
 from .user_agents import get_headers
+from .utils import parse_html, strip_scripts, element_text, create_async_http_client, run_sync
 from datetime import datetime
+import hashlib
 import json
+import orjson
 import re
+import time
+
+
+TOGETHER_BASE_URL = "https://api.together.xyz/v1"
+
+# "Last updated"-style dates, tried in order; compiled once rather than per page
+_DATE_PATTERNS = [
+    re.compile(r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*([A-Za-z]+ \d{1,2},? \d{4})', re.IGNORECASE),
+    re.compile(r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*(\d{1,2}/\d{1,2}/\d{4})', re.IGNORECASE),
+    re.compile(r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*(\d{4}-\d{2}-\d{2})', re.IGNORECASE),
+]
+
+
+# Page validation needles, each set matched in one case-insensitive pass
+# instead of lowercasing a copy of the whole page per substring test
+_HTML_TAG_RE = re.compile(r'<(?:html|body|div)', re.IGNORECASE)
+_ERROR_PAGE_RE = re.compile(
+    r'404 not found|page not found|error occurred|access denied', re.IGNORECASE
+)
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Terms behind every category the prompt asks about (data sale, arbitration,
+# tracking, location, retention, children); sentences without one are not
+# sent to the model
+_CONCERN_RE = re.compile(
+    r'sell|sale|rent|monetiz|licens|third[- ]part|share|sharing|disclos|partner'
+    r'|arbitrat|class action|jury|waive|litigation|dispute'
+    r'|cookie|track|analytic|pixel|beacon|advertis'
+    r'|location|geolocat|gps'
+    r'|retain|retention|delet|store|storage|keep'
+    r'|child|minor|under 1[36]|coppa|parent',
+    re.IGNORECASE
+)
+
+# Page chrome dropped before the text is sent; it spends prompt tokens
+# and pushes policy text out of the truncation window
+BOILERPLATE_TAGS = ('noscript', 'nav', 'header', 'footer', 'svg', 'iframe')
+
+# Elements that usually hold just the policy on long pages
+CONTENT_TAGS = ('main', 'article')
+
+# Prompt text budget; about 5k Llama tokens at roughly four characters each
+MIN_TEXT_CHARS = 200
+MAX_TEXT_CHARS = 20000
+
+# Identical for every document, so providers' prompt-prefix caches can serve
+# it; only the document text appended after it is new input per request
+STATIC_INSTRUCTIONS = """You are a legal document analyzer. Return only valid JSON arrays with no markdown formatting.
+
+You are analyzing a legal policy document. Extract important clauses that users should be aware of.
+
+Focus on these categories:
+- **Data Sale/Sharing**: Any mention of selling, renting, monetizing, sharing, or licensing user data to third parties
+- **Arbitration**: Forced arbitration, class action waivers, litigation restrictions
+- **Tracking**: Analytics, cookies, pixels, user behavior tracking
+- **Location Data**: GPS, location tracking, geolocation
+- **Data Retention**: How long data is kept
+- **Children's Data**: COPPA compliance, data from minors
+
+For each concerning clause you find:
+1. Extract the EXACT text as it appears (preserve capitalization, punctuation, spacing)
+2. Identify the section heading it belongs to
+3. Categorize it (dataSale, arbitration, tracking, location, retention, children)
+4. Rate severity (high, medium, low)
+
+Return ONLY a JSON array of clauses. Each clause must have:
+- "text": exact clause text (verbatim from document)
+- "section": section heading
+- "category": one of the categories above
+- "severity": high, medium, or low
+- "reason": brief explanation why it's concerning"""
+
+# First pass on the fast model: which numbered paragraphs deserve the full
+# extraction prompt at all
+SCREENING_INSTRUCTIONS = """You screen paragraphs of a legal policy document. Each paragraph is prefixed with its number in square brackets.
+
+Return a JSON array of the numbers of every paragraph that mentions any of: selling, sharing or licensing user data; arbitration or class action waivers; tracking, cookies or analytics; location data; data retention; children's data.
+
+When unsure, include the paragraph. Return [] if none qualify."""
+
+# Part of every response cache key; bump whenever STATIC_INSTRUCTIONS,
+# SCREENING_INSTRUCTIONS or the requests built from them change so stale
+# replies are not reused
+PROMPT_VERSION = 3
+
+# Constrains decoding to the clause array STATIC_INSTRUCTIONS describes, so
+# replies arrive as bare JSON with no markdown fence to strip
+_CLAUSES_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "clauses",
+        "schema": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "text": {"type": "string"},
+                    "section": {"type": "string"},
+                    "category": {"enum": ["dataSale", "arbitration", "tracking", "location", "retention", "children"]},
+                    "severity": {"enum": ["high", "medium", "low"]},
+                    "reason": {"type": "string"}
+                },
+                "required": ["text", "category", "severity"]
+            }
+        }
+    }
+}
+
+_SCREENING_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "paragraphs",
+        "schema": {"type": "array", "items": {"type": "integer"}}
+    }
+}
+
+# Failures that outlast the SDK's own retries mean the API itself is unwell,
+# not that one request was bad
+_API_OUTAGE_ERRORS = (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)
+
+# Batch statuses after which a batch's output will not change
+_BATCH_TERMINAL_STATUSES = frozenset(['completed', 'failed', 'expired', 'cancelled'])
 
 
 class LlamaExtractor:
     """Extract clauses from legal documents using Llama AI."""
     
-    def __init__(self, timeout: int = 30):
-        """Initialize Llama Stack client with Together AI."""
+    # Documents fetched and sent to the model at once by extract_documents
+    MAX_CONCURRENT_DOCUMENTS = 8
+    
+    # The SDK retries timeouts, 429s and 5xx responses itself, with jittered
+    # exponential backoff that honours Retry-After
+    API_MAX_RETRIES = 5
+    
+    # Consecutive documents whose model call still failed before the API is
+    # left alone; after CIRCUIT_BREAKER_COOLDOWN seconds one call may try again
+    CIRCUIT_BREAKER_THRESHOLD = 3
+    CIRCUIT_BREAKER_COOLDOWN = 60
+    
+    # Page bodies are streamed in CHUNK_SIZE pieces and abandoned past MAX_HTML_BYTES
+    CHUNK_SIZE = 65536
+    MAX_HTML_BYTES = 5_000_000
+    
+    # Size of the numbered paragraphs the fast model screens
+    PARAGRAPH_CHARS = 1000
+    
+    def __init__(self, timeout: int = 30, cache: Optional[LLMCache] = None):
+        """
+        Initialize Llama Stack client with Together AI.
+        
+        Model replies are cached on disk by request; a cache passed in is
+        left open by close() for its owner to close.
+        """
         self.timeout = timeout
-        self.http_client = httpx.Client(timeout=timeout, follow_redirects=True)
         
         # Initialize OpenAI client pointing to Together AI
         api_key = os.getenv("TOGETHER_API_KEY")
         if not api_key:
             raise ValueError("TOGETHER_API_KEY environment variable not set")
         
-        # Use Together AI via OpenAI-compatible API
+        # Use Together AI via OpenAI-compatible API; page extraction opens an
+        # async client per run, this one serves the Batch API
+        self._api_key = api_key
         self.client = OpenAI(
             api_key=api_key,
-            base_url="https://api.together.xyz/v1"
+            base_url=TOGETHER_BASE_URL,
+            max_retries=self.API_MAX_RETRIES
         )
         
+        # Circuit breaker state, shared by every event loop using this
+        # extractor (scan_many runs scans on several threads)
+        self._circuit_lock = threading.Lock()
+        self._api_failures = 0
+        self._circuit_opened_at = 0.0
+        
         # Use Llama 3.3 70B for best extraction quality
         self.model = "meta-llama/Llama-3.3-70B-Instruct-Turbo"
-    
-    def cleanup(self):
-        """Close the HTTP client."""
-        if hasattr(self, 'http_client'):
-            self.http_client.close()
+        
+        # An 8B model decides which paragraphs reach the 70B one, at a
+        # fraction of the cost per token
+        self.fast_model = "meta-llama/Llama-3.1-8B-Instruct-Turbo"
+        
+        self._owns_cache = cache is None
+        self.cache = cache or LLMCache()
+        
+        # Batch ID -> {url: (doc_type, title, last_updated, cache_key)} until collected
+        self._pending_batches: dict[str, dict[str, tuple]] = {}
+        
+        # HTML parsing pool, started by the first multi-document extraction
+        # and reused until close()
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
     
     def extract_document(self, url: str, doc_type: str) -> Optional[Document]:
         """
@@ -44,226 +219,651 @@ class LlamaExtractor:
         
         Returns Document with intelligently parsed clauses.
         """
-        try:
-            # Fetch the HTML with random user-agent
-            response = self.http_client.get(url, headers=get_headers())
-            response.raise_for_status()
+        return self.extract_documents([(url, doc_type)])[0]
+    
+    def extract_documents(self, items: list[tuple[str, str]]) -> list[Optional[Document]]:
+        """
+        Extract several (url, doc_type) documents concurrently.
+        
+        Page fetches and model calls overlap across up to
+        MAX_CONCURRENT_DOCUMENTS documents. Results follow the order of items,
+        with None wherever extract_document would have returned None.
+        """
+        if not items:
+            return []
+        
+        # Parsing holds the GIL, so with several pages in flight it is spread
+        # over processes; a single page is parsed in a thread
+        pool = self._get_parse_pool() if len(items) > 1 else None
+        return run_sync(self._extract_documents(items, pool))
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """
+        Return the parsing process pool, starting it on first use.
+        
+        Workers are started by a forkserver where the platform has one, so
+        they are never forked from this process after scan_many has started
+        threads. As with any non-fork pool, the entry script must guard its
+        top-level code with if __name__ == '__main__'.
+        """
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=min(self.MAX_CONCURRENT_DOCUMENTS, os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context(start_method)
+                )
+            return self._parse_pool
+    
+    def _discard_parse_pool(self, pool: Executor):
+        """Drop a broken parsing pool so the next extraction starts a fresh one."""
+        with self._parse_pool_lock:
+            if self._parse_pool is pool:
+                self._parse_pool = None
+        pool.shutdown(wait=False)
+    
+    async def _extract_documents(
+        self,
+        items: list[tuple[str, str]],
+        pool: Optional[Executor] = None
+    ) -> list[Optional[Document]]:
+        """Fan extraction of items out over one async HTTP client and one async API client."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DOCUMENTS)
+        
+        async with create_async_http_client(self.timeout) as http_client, \
+                AsyncOpenAI(api_key=self._api_key, base_url=TOGETHER_BASE_URL,
+                            max_retries=self.API_MAX_RETRIES) as ai_client:
+            async def extract(url: str, doc_type: str) -> Optional[Document]:
+                async with semaphore:
+                    return await self._extract_document(http_client, ai_client, url, doc_type, pool)
             
-            # Validate content before processing
-            if not self._is_valid_html_content(response):
+            return await asyncio.gather(*(extract(url, doc_type) for url, doc_type in items))
+    
+    async def _extract_document(
+        self,
+        http_client: httpx.AsyncClient,
+        ai_client: AsyncOpenAI,
+        url: str,
+        doc_type: str,
+        pool: Optional[Executor] = None
+    ) -> Optional[Document]:
+        """
+        Fetch, parse and extract one document for extract_documents.
+        
+        HTML parsing runs in pool when one is given, else in a worker thread.
+        """
+        try:
+            html = await self._fetch_page(http_client, url)
+            if html is None:
                 return None
             
-            html = response.text
-            
-            # Extract metadata
-            title = self._extract_title(html)
-            last_updated = self._extract_last_updated(html)
-            
-            # Use AI to extract clauses
-            clauses = self._extract_clauses_with_ai(html, url, doc_type, last_updated)
+            # Parsing is CPU-bound; keep it off the event loop
+            if pool is None:
+                title, last_updated, text_content = await asyncio.to_thread(_parse_page, html)
+            else:
+                loop = asyncio.get_running_loop()
+                try:
+                    title, last_updated, text_content = await loop.run_in_executor(pool, _parse_page, html)
+                except BrokenProcessPool:
+                    # A worker died, e.g. killed for memory; finish this page
+                    # in a thread and let the next run start a new pool
+                    self._discard_parse_pool(pool)
+                    title, last_updated, text_content = await asyncio.to_thread(_parse_page, html)
             
-            if not clauses:
-                print(f"No clauses extracted from {url}")
-            
-            # Always return a Document, even if no clauses found
-            # This ensures all fetched documents appear in metadata
-            document = Document(
-                url=url,
-                doc_type=doc_type,
-                title=title,
-                last_updated=last_updated,
-                clauses=clauses  # May be empty list
-            )
+            clauses = []
+            if text_content is not None:
+                clauses = await self._extract_clauses_with_ai(
+                    ai_client, text_content, url, doc_type, last_updated
+                )
             
-            return document
+            return self._build_document(url, doc_type, title, last_updated, clauses)
         
         except Exception as e:
             print(f"AI extraction error for {url}: {e}")
             return None
     
-    def _is_valid_html_content(self, response: httpx.Response) -> bool:
+    def _build_document(
+        self,
+        url: str,
+        doc_type: str,
+        title: str,
+        last_updated: Optional[str],
+        clauses: list[Clause]
+    ) -> Document:
+        """Wrap extracted clauses in a Document."""
+        if not clauses:
+            print(f"No clauses extracted from {url}")
+        
+        # Always return a Document, even if no clauses found
+        # This ensures all fetched documents appear in metadata
+        return Document(
+            url=url,
+            doc_type=doc_type,
+            title=title,
+            last_updated=last_updated,
+            clauses=clauses  # May be empty list
+        )
+    
+    def submit_batch(self, items: list[tuple[str, str]]) -> Optional[str]:
+        """
+        Queue extraction of many (url, doc_type) documents through the Batch API.
+        
+        Pages are fetched now and every prompt is uploaded as one JSONL file,
+        keyed by URL; batched requests are billed at a discount and do not
+        count against the synchronous rate limits. Returns the batch ID to
+        pass to collect_batch, or None if no page was usable.
+        """
+        lines = []
+        pending = {}
+        
+        pages = run_sync(self._load_pages([url for url, _ in items]))
+        
+        for (url, doc_type), page in zip(items, pages):
+            if page is None:
+                continue
+            
+            title, last_updated, text_content = page
+            if text_content is None:
+                pending[url] = (doc_type, title, last_updated, None)
+                continue
+            pending[url] = (doc_type, title, last_updated, self._cache_key(text_content))
+            
+            lines.append(orjson.dumps({
+                "custom_id": url,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._completion_request(text_content)
+            }))
+        
+        if not lines:
+            return None
+        
+        batch_file = self.client.files.create(
+            file=("policyboom_batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        self._pending_batches[batch.id] = pending
+        return batch.id
+    
+    async def _load_pages(self, urls: list[str]) -> list[Optional[tuple[str, Optional[str], Optional[str]]]]:
+        """Fetch and parse urls concurrently; None marks a page that failed or was unusable."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DOCUMENTS)
+        
+        async with create_async_http_client(self.timeout) as http_client:
+            async def load(url: str):
+                async with semaphore:
+                    try:
+                        html = await self._fetch_page(http_client, url)
+                        if html is None:
+                            return None
+                        return await asyncio.to_thread(_parse_page, html)
+                    except Exception as e:
+                        print(f"AI extraction error for {url}: {e}")
+                        return None
+            
+            return await asyncio.gather(*(load(url) for url in urls))
+    
+    def collect_batch(self, batch_id: str, poll_interval: float = 30) -> dict[str, Document]:
         """
-        Validate that response contains valid HTML suitable for AI extraction.
+        Wait for a batch from submit_batch to finish and build its Documents.
         
-        Checks Content-Type, length, and basic HTML structure.
+        Returns Documents keyed by URL; pages whose text was too short to
+        send come back with no clauses, as they do from extract_document.
         """
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch_id)
+        
+        pending = self._pending_batches.pop(batch_id, {})
+        replies = {}
+        
+        if batch.status != 'completed' or not batch.output_file_id:
+            print(f"Batch {batch_id} ended with status {batch.status}")
+        else:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                result = orjson.loads(line)
+                body = (result.get('response') or {}).get('body') or {}
+                choices = body.get('choices') or [{}]
+                replies[result['custom_id']] = choices[0].get('message', {}).get('content')
+        
+        # URLs submitted by another extractor instance carry no page metadata
+        for url in replies.keys() - pending.keys():
+            pending[url] = ('Legal Document', 'Legal Document', None, None)
+        
+        documents = {}
+        for url, (doc_type, title, last_updated, cache_key) in pending.items():
+            clauses = []
+            content = replies.get(url)
+            try:
+                clauses = self._parse_ai_clauses(content, url, doc_type, last_updated)
+                if cache_key and content:
+                    self.cache.set(cache_key, content)
+            except json.JSONDecodeError as e:
+                self._report_bad_json(e, content)
+            except Exception as e:
+                print(f"AI extraction failed: {e}")
+            
+            documents[url] = self._build_document(url, doc_type, title, last_updated, clauses)
+        
+        return documents
+    
+    async def _fetch_page(self, http_client: httpx.AsyncClient, url: str) -> Optional[str]:
+        """
+        Download a page and return its HTML if it is suitable for AI extraction.
+        
+        Non-HTML and oversized responses are rejected from their headers, or
+        as soon as the body passes MAX_HTML_BYTES, without downloading or
+        decoding the rest.
+        """
+        async with http_client.stream("GET", url, headers=get_headers()) as response:
+            response.raise_for_status()
+            
+            if not self._is_acceptable_response(response):
+                return None
+            
+            body = bytearray()
+            async for chunk in response.aiter_bytes(chunk_size=self.CHUNK_SIZE):
+                body += chunk
+                if len(body) > self.MAX_HTML_BYTES:
+                    return None
+            
+            content = body.decode(response.encoding or "utf-8", errors="replace")
+        
+        return content if self._is_valid_html_content(content) else None
+    
+    def _is_acceptable_response(self, response: httpx.Response) -> bool:
+        """Check a response's headers before any of its body is read."""
         # Check Content-Type header
         content_type = response.headers.get('content-type', '').lower()
         if 'html' not in content_type:
             return False
         
+        content_length = response.headers.get('content-length', '')
+        if content_length.isdigit() and int(content_length) > self.MAX_HTML_BYTES:
+            return False
+        
+        return True
+    
+    def _is_valid_html_content(self, content: str) -> bool:
+        """
+        Validate that a page body is HTML suitable for AI extraction.
+        
+        Checks length, basic HTML structure, and error page markers.
+        """
         # Check content length (minimum 500 chars, max 5MB)
-        content = response.text
-        if len(content) < 500 or len(content) > 5_000_000:
+        if len(content) < 500 or len(content) > self.MAX_HTML_BYTES:
             return False
         
         # Check for basic HTML structure (has opening tags)
-        if not ('<html' in content.lower() or '<body' in content.lower() or '<div' in content.lower()):
+        if _HTML_TAG_RE.search(content) is None:
             return False
         
         # Check it's not an error page (common error page indicators)
-        content_lower = content.lower()
-        error_indicators = ['404 not found', 'page not found', 'error occurred', 'access denied']
-        if any(indicator in content_lower[:1000] for indicator in error_indicators):
+        if _ERROR_PAGE_RE.search(content, 0, 1000) is not None:
             return False
         
         return True
     
-    def _extract_clauses_with_ai(self, html: str, url: str, doc_type: str, last_updated: Optional[str]) -> list[Clause]:
-        """Use Llama AI to intelligently extract and categorize clauses."""
-        
-        # Remove HTML tags but preserve structure
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'lxml')
-        
-        # Get clean text with preserved spacing
-        text_content = soup.get_text(separator=' ', strip=True)
-        
-        # Validate text content has enough substance
-        if len(text_content) < 200:
-            return []
+    async def _extract_clauses_with_ai(
+        self,
+        ai_client: AsyncOpenAI,
+        text_content: str,
+        url: str,
+        doc_type: str,
+        last_updated: Optional[str]
+    ) -> list[Clause]:
+        """Use Llama AI to extract and categorize clauses from text prepared by _prepare_text."""
+        cache_key = self._cache_key(text_content)
+        content = None  # Initialize for error handling
         
-        # Limit to reasonable size (Llama can handle long context but be efficient)
-        if len(text_content) > 20000:
-            text_content = text_content[:20000]
-        
-        # Craft extraction prompt
-        prompt = f"""You are analyzing a legal policy document. Extract important clauses that users should be aware of.
-
-Focus on these categories:
-- **Data Sale/Sharing**: Any mention of selling, renting, monetizing, sharing, or licensing user data to third parties
-- **Arbitration**: Forced arbitration, class action waivers, litigation restrictions
-- **Tracking**: Analytics, cookies, pixels, user behavior tracking
-- **Location Data**: GPS, location tracking, geolocation
-- **Data Retention**: How long data is kept
-- **Children's Data**: COPPA compliance, data from minors
-
-For each concerning clause you find:
-1. Extract the EXACT text as it appears (preserve capitalization, punctuation, spacing)
-2. Identify the section heading it belongs to
-3. Categorize it (dataSale, arbitration, tracking, location, retention, children)
-4. Rate severity (high, medium, low)
-
-Return ONLY a JSON array of clauses. Each clause must have:
-- "text": exact clause text (verbatim from document)
-- "section": section heading
-- "category": one of the categories above
-- "severity": high, medium, or low
-- "reason": brief explanation why it's concerning
-
-Document text:
-{text_content}
-
-Return valid JSON only, no markdown formatting:"""
-
         try:
-            content = None  # Initialize for error handling
-            
-            # Call Llama via Together AI
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a legal document analyzer. Return only valid JSON arrays with no markdown formatting."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,  # Low temperature for consistent extraction
-                max_tokens=4096
-            )
+            content = self.cache.get(cache_key)
+            cached = content is not None
             
-            # Parse response
-            content = response.choices[0].message.content
-            if not content:
-                return []
+            if not cached:
+                # Call Llama via Together AI, on the paragraphs the fast model flagged
+                candidates = await self._screen_passages(ai_client, text_content)
+                content = await self._call_llm(ai_client, candidates) if candidates else "[]"
             
-            content = content.strip()
+            clauses = self._parse_ai_clauses(content, url, doc_type, last_updated)
             
-            # Remove markdown code blocks if present
-            if content.startswith("```"):
-                content = re.sub(r'^```(?:json)?\n?', '', content)
-                content = re.sub(r'\n?```$', '', content)
-            
-            # Parse JSON
-            extracted_clauses = json.loads(content)
-            
-            # Convert to Clause objects
-            clauses = []
-            for idx, clause_data in enumerate(extracted_clauses):
-                # Generate unique ID
-                clause_id = f"clause_ai_{idx}_{hash(clause_data.get('text', '')[:50]) % 10000}"
-                
-                clause = Clause(
-                    id=clause_id,
-                    text=clause_data.get('text', ''),
-                    section_title=clause_data.get('section', 'General'),
-                    paragraph_index=idx,
-                    document_url=url,
-                    document_type=doc_type,
-                    last_updated=last_updated,
-                    context_before="",
-                    context_after="",
-                    ai_category=clause_data.get('category'),
-                    ai_severity=clause_data.get('severity'),
-                    ai_reason=clause_data.get('reason')
-                )
-                clauses.append(clause)
+            # Only replies that parsed are worth replaying
+            if not cached and content:
+                self.cache.set(cache_key, content)
             
             return clauses
         
         except json.JSONDecodeError as e:
-            print(f"Failed to parse AI response as JSON: {e}")
-            if content is not None:
-                print(f"Response was: {content[:500]}")
+            self._report_bad_json(e, content)
             return []
         except Exception as e:
             print(f"AI extraction failed: {e}")
             return []
     
-    def _extract_title(self, html: str) -> str:
-        """Extract document title."""
+    async def _call_llm(self, ai_client: AsyncOpenAI, text_content: str) -> Optional[str]:
+        """Request a completion for one document's text and return the reply."""
+        return await self._complete(ai_client, self._completion_request(text_content))
+    
+    async def _screen_passages(self, ai_client: AsyncOpenAI, text_content: str) -> str:
+        """
+        Keep the paragraphs of text_content the fast model flags as concerning.
+        
+        Text of a single paragraph is returned as is, without a model call.
+        """
+        paragraphs = self._paragraphs(text_content)
+        if len(paragraphs) < 2:
+            return text_content
+        
+        reply = await self._complete(ai_client, self._screening_request(paragraphs))
+        return self._screened_text(paragraphs, reply)
+    
+    async def _complete(self, ai_client: AsyncOpenAI, request: dict) -> Optional[str]:
+        """Send one chat completion request, counting outages for the circuit breaker."""
+        self._check_circuit()
+        
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'lxml')
-            
-            title_tag = soup.find('title')
-            if title_tag:
-                return title_tag.get_text(strip=True)
-            
-            h1 = soup.find('h1')
-            if h1:
-                return h1.get_text(strip=True)
-        except:
-            pass
+            response = await ai_client.chat.completions.create(**request)
+        except _API_OUTAGE_ERRORS:
+            self._record_api_failure()
+            raise
+        
+        with self._circuit_lock:
+            self._api_failures = 0
+        return response.choices[0].message.content
+    
+    def _check_circuit(self):
+        """
+        Raise instead of calling the API once it has failed CIRCUIT_BREAKER_THRESHOLD times running.
+        
+        An extractor is reused across scans, so once the cooldown has passed
+        a single call is let through; it failing opens the circuit again.
+        """
+        with self._circuit_lock:
+            if self._api_failures >= self.CIRCUIT_BREAKER_THRESHOLD:
+                if time.monotonic() - self._circuit_opened_at < self.CIRCUIT_BREAKER_COOLDOWN:
+                    raise RuntimeError("Together API unavailable after repeated failures; skipping model call")
+                self._api_failures = self.CIRCUIT_BREAKER_THRESHOLD - 1
+    
+    def _record_api_failure(self):
+        """Count a failed model call, opening the circuit at the threshold."""
+        with self._circuit_lock:
+            self._api_failures += 1
+            if self._api_failures >= self.CIRCUIT_BREAKER_THRESHOLD:
+                self._circuit_opened_at = time.monotonic()
+    
+    def _paragraphs(self, text: str) -> list[str]:
+        """Group whole sentences of text into paragraphs of about PARAGRAPH_CHARS."""
+        paragraphs = []
+        current = []
+        size = 0
+        
+        for sentence in _SENTENCE_SPLIT_RE.split(text):
+            current.append(sentence)
+            size += len(sentence) + 1
+            if size >= self.PARAGRAPH_CHARS:
+                paragraphs.append(' '.join(current))
+                current = []
+                size = 0
         
-        return "Legal Document"
+        if current:
+            paragraphs.append(' '.join(current))
+        
+        return paragraphs
     
-    def _extract_last_updated(self, html: str) -> Optional[str]:
-        """Extract last updated date."""
+    def _screened_text(self, paragraphs: list[str], reply: Optional[str]) -> str:
+        """
+        Join the paragraphs whose numbers the screening reply lists.
+        
+        A reply that is not a JSON array keeps every paragraph, so a bad
+        screen costs tokens rather than clauses.
+        """
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'lxml')
-            text = soup.get_text()
-            
-            patterns = [
-                r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*([A-Za-z]+ \d{1,2},? \d{4})',
-                r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*(\d{1,2}/\d{1,2}/\d{4})',
-                r'(?:last updated|last modified|updated|effective date|last revised)[\s:]*(\d{4}-\d{2}-\d{2})',
-            ]
+            flagged = orjson.loads(reply or "")
+        except orjson.JSONDecodeError:
+            flagged = None
+        
+        if not isinstance(flagged, list):
+            return ' '.join(paragraphs)
+        
+        keep = sorted({i for i in flagged if isinstance(i, int) and 0 <= i < len(paragraphs)})
+        return ' '.join(paragraphs[i] for i in keep)
+    
+    def _cache_key(self, text_content: str) -> str:
+        """Key of the response cache entry for one document's text."""
+        return hashlib.sha256(
+            f"{self.model}|{self.fast_model}|v{PROMPT_VERSION}|{text_content}".encode()
+        ).hexdigest()
+    
+    def _screening_request(self, paragraphs: list[str]) -> dict:
+        """Build the fast model's request to flag concerning paragraphs."""
+        numbered = "\n\n".join(f"[{i}] {paragraph}" for i, paragraph in enumerate(paragraphs))
+        
+        return {
+            "model": self.fast_model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": SCREENING_INSTRUCTIONS
+                },
+                {
+                    "role": "user",
+                    "content": f"Paragraphs:\n{numbered}\n\nReturn a JSON array of paragraph numbers only:"
+                }
+            ],
+            "response_format": _SCREENING_RESPONSE_FORMAT,
+            "temperature": 0,
+            "max_tokens": 512
+        }
+    
+    def _completion_request(self, text_content: str) -> dict:
+        """Build the chat completion arguments for one document's text."""
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": STATIC_INSTRUCTIONS
+                },
+                {
+                    "role": "user",
+                    # The document goes last so everything before it is a
+                    # byte-identical prefix across requests
+                    "content": f"Document text:\n{text_content}\n\nReturn valid JSON only, no markdown formatting:"
+                }
+            ],
+            "response_format": _CLAUSES_RESPONSE_FORMAT,
+            "temperature": 0.1,  # Low temperature for consistent extraction
+            "max_tokens": 4096
+        }
+    
+    def _parse_ai_clauses(
+        self,
+        content: Optional[str],
+        url: str,
+        doc_type: str,
+        last_updated: Optional[str]
+    ) -> list[Clause]:
+        """
+        Turn the model's JSON reply into Clause objects.
+        
+        Replies are schema-constrained, so a json.JSONDecodeError (raised
+        as is) only comes from one cut off at max_tokens.
+        """
+        if not content:
+            return []
+        
+        # orjson parses straight from the str; its JSONDecodeError subclasses json's
+        extracted_clauses = orjson.loads(content)
+        
+        # Convert to Clause objects
+        clauses = []
+        for idx, clause_data in enumerate(extracted_clauses):
+            # Stable across runs, unlike the per-process salted hash(); the URL
+            # keeps identical boilerplate in two documents from colliding
+            digest = hashlib.blake2b(
+                f"{url}:{clause_data.get('text', '')}".encode(), digest_size=6, usedforsecurity=False
+            ).hexdigest()
+            clause_id = f"clause_ai_{idx}_{digest}"
             
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    return match.group(1)
-        except:
-            pass
+            clause = Clause(
+                id=clause_id,
+                text=clause_data.get('text', ''),
+                section_title=clause_data.get('section', 'General'),
+                paragraph_index=idx,
+                document_url=url,
+                document_type=doc_type,
+                last_updated=last_updated,
+                context_before="",
+                context_after="",
+                ai_category=clause_data.get('category'),
+                ai_severity=clause_data.get('severity'),
+                ai_reason=clause_data.get('reason')
+            )
+            clauses.append(clause)
         
-        return None
+        return clauses
+    
+    def _report_bad_json(self, error: json.JSONDecodeError, content: Optional[str]):
+        """Log a model reply that failed to parse as JSON."""
+        print(f"Failed to parse AI response as JSON: {error}")
+        if content is not None:
+            print(f"Response was: {content[:500]}")
     
     def close(self):
-        """Close HTTP client."""
-        self.http_client.close()
+        """Shut down the parsing pool and close the API client and response cache."""
+        with self._parse_pool_lock:
+            pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.shutdown()
+        
+        self.client.close()
+        if self._owns_cache:
+            self.cache.close()
+
+
+def _parse(html: str):
+    """
+    Parse a page once for every helper that reads it.
+    
+    lxml builds the tree in C, without BeautifulSoup's per-node Python
+    objects; script and style text is dropped, as get_text did.
+    """
+    root = parse_html(html)
+    strip_scripts(root)
+    return root
+
+
+def _parse_page(html: str) -> tuple[str, Optional[str], Optional[str]]:
+    """
+    Return the title, last-updated date and model-ready text of a page.
+    
+    The tree is dropped on return, so it is not held in memory for the
+    duration of the model call. Module-level, like the helpers it calls,
+    so a process pool can run it with only html and the small result
+    tuple crossing the process boundary.
+    """
+    root = _parse(html)
+    return _extract_title(root), _extract_last_updated(root), _prepare_text(root)
+
+
+def _prepare_text(root) -> Optional[str]:
+    """
+    Reduce a parsed page to the text sent to the model, or None if too little remains.
+    
+    Removes BOILERPLATE_TAGS from the tree, so call it after the other
+    helpers have read the page.
+    """
+    for element in list(root.iter(*BOILERPLATE_TAGS)):
+        element.drop_tree()
+    
+    # Get clean text with whitespace runs collapsed
+    text_content = ' '.join(element_text(root).split())
+    
+    # Too long for the window: prefer the largest <main>/<article>, if any,
+    # so navigation-heavy pages still get their policy text in
+    if len(text_content) > MAX_TEXT_CHARS:
+        candidates = (' '.join(element_text(element).split()) for element in root.iter(*CONTENT_TAGS))
+        main_text = max(candidates, key=len, default='')
+        if len(main_text) >= MIN_TEXT_CHARS:
+            text_content = main_text
+    
+    # Validate text content has enough substance
+    if len(text_content) < MIN_TEXT_CHARS:
+        return None
+    
+    # Only passages that could hold a concerning clause go to the model
+    text_content = _relevant_passages(text_content)
+    if not text_content:
+        return None
+    
+    # Limit to reasonable size (Llama can handle long context but be efficient)
+    if len(text_content) > MAX_TEXT_CHARS:
+        text_content = text_content[:MAX_TEXT_CHARS]
+        
+        # End on the last complete sentence; a clause cut mid-way is
+        # tokens the model cannot quote. Keep the raw cut if the last
+        # sentence boundary would throw away most of the window.
+        end = max(text_content.rfind('. '), text_content.rfind('! '), text_content.rfind('? '))
+        if end >= MAX_TEXT_CHARS // 2:
+            text_content = text_content[:end + 1]
+    
+    return text_content
+
+
+def _relevant_passages(text: str) -> str:
+    """
+    Keep the sentences that mention a watched topic, each with one neighbour either side.
+    
+    A regex scan costs next to nothing beside model input tokens, and
+    most of a policy is prose no category cares about. Returns an empty
+    string when nothing matches.
+    """
+    sentences = _SENTENCE_SPLIT_RE.split(text)
+    
+    keep = set()
+    for i, sentence in enumerate(sentences):
+        if _CONCERN_RE.search(sentence):
+            keep.update((i - 1, i, i + 1))
+    
+    return ' '.join(sentences[i] for i in sorted(keep) if 0 <= i < len(sentences))
+
+
+def _extract_title(root) -> str:
+    """Extract document title."""
+    try:
+        title_tag = next(root.iter('title'), None)
+        if title_tag is not None:
+            return element_text(title_tag, separator='')
+        
+        h1 = next(root.iter('h1'), None)
+        if h1 is not None:
+            return element_text(h1, separator='')
+    except:
+        pass
+    
+    return "Legal Document"
+
+
+def _extract_last_updated(root) -> Optional[str]:
+    """Extract last updated date."""
+    try:
+        text = root.text_content()
+        
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                return match.group(1)
+    except:
+        pass
+    
+    return None
@@ -0,0 +1,53 @@
+"""Disk-backed cache of LLM responses, keyed by a hash of the request."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class LLMCache:
+    """SQLite store mapping request hashes to raw model replies."""
+    
+    def __init__(self, db_path: Optional[str] = None):
+        """Open (creating if needed) the cache database."""
+        if db_path is None:
+            home = Path.home()
+            db_dir = home / ".policyboom"
+            db_dir.mkdir(exist_ok=True)
+            db_path = str(db_dir / "llm_cache.db")
+        
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                hash TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at INTEGER NOT NULL
+            )
+        """)
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, if any."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT response FROM llm_responses WHERE hash = ?", (key,)
+            ).fetchone()
+        
+        return row[0] if row else None
+    
+    def set(self, key: str, value: str):
+        """Store the response for key, replacing any previous one."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (hash, response, created_at) VALUES (?, ?, ?)",
+                (key, value, int(time.time()))
+            )
+    
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
@@ -1,11 +1,16 @@
 """Data models for PolicyBoom."""
 
+import csv
+import orjson
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from enum import Enum
 
 
+__all__ = ["Clause", "Finding", "Document", "Scan", "ScanResult", "Severity", "Category"]
+
+
 class Severity(str, Enum):
     """Severity levels for findings."""
     HIGH = "high"
@@ -23,7 +28,7 @@ class Category(str, Enum):
     CHILDREN_DATA = "childrenData"
 
 
-@dataclass
+@dataclass(slots=True)
 class Clause:
     """Represents a single clause in a legal document."""
     id: str
@@ -41,7 +46,7 @@ class Clause:
     ai_reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """Represents a concerning clause finding with full evidence and source attribution.
     
@@ -62,7 +67,7 @@ class Finding:
     last_updated: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Represents a legal document."""
     url: str
@@ -72,7 +77,7 @@ class Document:
     clauses: list[Clause] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Scan:
     """Represents a complete scan of a domain."""
     id: str
@@ -83,7 +88,7 @@ class Scan:
     findings: list[Finding] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """Result object returned by scanner operations."""
     scan: Scan
@@ -92,8 +97,6 @@ class ScanResult:
     
     def export(self, filename: str, format: str = "json"):
         """Export results to file with full evidence and metadata."""
-        import json
-        
         if format == "json":
             data = {
                 "scan_id": self.scan.id,
@@ -120,18 +123,17 @@ class ScanResult:
                 ],
                 "metadata": self.metadata,
             }
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         elif format == "csv":
-            import csv
-            with open(filename, 'w', newline='') as f:
+            with open(filename, 'w', newline='', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 writer.writerow([
                     "Clause ID", "Category", "Severity", "Section",
                     "Document Type", "Snippet", "Full Text", "URL", "Last Updated"
                 ])
-                for finding in self.findings:
-                    writer.writerow([
+                writer.writerows(
+                    (
                         finding.clause_id,
                         finding.category.value,
                         finding.severity.value,
@@ -141,4 +143,6 @@ class ScanResult:
                         finding.full_text[:200] if finding.full_text else "",
                         finding.document_url,
                         finding.last_updated or "Unknown",
-                    ])
+                    )
+                    for finding in self.findings
+                )
@@ -3,13 +3,48 @@
 from .models import Scan, ScanResult, Severity, Category, Finding
 from .discovery import Discovery
 from .extraction import Extraction
-from .llama_extraction import LlamaExtractor
 from .analysis import Analysis
 from .database import Database
+from .utils import create_http_client
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import uuid
+from functools import lru_cache
+from itertools import chain, islice
+import asyncio
+import httpx
+import logging
 import os
 from typing import Optional
+from uuid import uuid4
+
+
+log = logging.getLogger(__name__)
+
+# Horizontal rules framing the terminal report
+_RULE = '=' * 80
+_DIVIDER = '─' * 80
+
+# Severity tags shown in the report, e.g. [HIGH]
+_SEVERITY_LABELS = {severity: severity.value.upper() for severity in Severity}
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    """Pooled client shared by every scan in this process, so later scans start with warm connections."""
+    return create_http_client()
+
+
+@lru_cache(maxsize=1)
+def _llama_extractor():
+    """
+    Build the AI extractor on the first AI scan and reuse it for the rest.
+    
+    The import is deferred too: it pulls in the OpenAI client, which
+    regex-only scans never need.
+    """
+    from .llama_extraction import LlamaExtractor
+    return LlamaExtractor()
 
 
 class ScanOperation:
@@ -19,8 +54,10 @@ class ScanOperation:
         """Initialize scan operation."""
         self.domain = domain
         self.db = db or Database()
-        self.scan_id = str(uuid.uuid4())
+        # 32 hex digits; export names still take the first 8
+        self.scan_id = uuid4().hex
         self._findings = None
+        self._by_severity = {}  # Severity -> findings, built once by _execute
         self._scan = None
         self._documents = []  # Track all fetched documents
         self._executed = False
@@ -30,24 +67,27 @@ class ScanOperation:
         if self._executed:
             return
         
-        print(f"🔍 Scanning {self.domain}...")
+        log.info("🔍 Scanning %s...", self.domain)
         
-        discovery = Discovery()
+        # One pooled client so connections opened during discovery are
+        # reused when the same documents are fetched for extraction
+        http_client = _shared_http_client()
+        discovery = Discovery(client=http_client, db=self.db)
         
         # Use AI-powered extraction if API key is available, otherwise fallback to regex
         use_ai = os.getenv("TOGETHER_API_KEY") is not None
         if use_ai:
-            print("  🤖 Using AI-powered extraction (Llama Stack)")
-            extraction = LlamaExtractor()
+            log.info("  🤖 Using AI-powered extraction (Llama Stack)")
+            extraction = _llama_extractor()
         else:
-            print("  📝 Using regex-based extraction")
-            extraction = Extraction()
+            log.info("  📝 Using regex-based extraction")
+            extraction = Extraction(client=http_client)
         
         analysis = Analysis()
         
         try:
             policy_urls = discovery.discover(self.domain)
-            print(f"📄 Found {len(policy_urls)} policy documents")
+            log.info("📄 Found %d policy documents", len(policy_urls))
             
             scan = Scan(
                 id=self.scan_id,
@@ -59,42 +99,58 @@ class ScanOperation:
             self.db.save_scan(scan)
             
             all_findings = []
+            results = []
             
             for policy in policy_urls:
-                url = policy['url']
-                doc_type = policy['doc_type']
-                
-                print(f"  📖 Extracting: {doc_type} ({url})")
-                
-                document = extraction.extract_document(url, doc_type)
+                log.info("  📖 Extracting: %s (%s)", policy['doc_type'], policy['url'])
+            
+            # Documents are fetched concurrently but come back in order, and
+            # are saved from this thread so SQLite only ever sees one writer
+            documents = extraction.extract_documents(
+                [(policy['url'], policy['doc_type']) for policy in policy_urls]
+            )
+            
+            for document in documents:
                 if not document:
                     continue
                 
                 # Track all documents, even if they have no findings
                 self._documents.append(document)
                 
-                doc_id = self.db.save_document(self.scan_id, document)
+                # A page with no clauses has nothing to analyse or store;
+                # metadata still lists it from _documents
+                if not document.clauses:
+                    continue
+                
+                # Flattened in C; the per-clause loop has no Python
+                # attribute lookups or extend calls left in it
+                doc_findings = list(chain.from_iterable(
+                    map(analysis.analyze_clause, document.clauses)
+                ))
                 
-                for clause in document.clauses:
-                    self.db.save_clause(doc_id, clause)
-                    
-                    findings = analysis.analyze_clause(clause)
-                    for finding in findings:
-                        self.db.save_finding(self.scan_id, finding)
-                        all_findings.append(finding)
+                results.append((document, doc_findings))
+                all_findings.extend(doc_findings)
             
+            # Every document, clause and finding plus the final status in one commit
             scan.status = "completed"
-            self.db.save_scan(scan)
+            self.db.save_scan_results(scan, results)
             
-            print(f"✅ Scan complete! Found {len(all_findings)} concerning clauses")
+            log.info("✅ Scan complete! Found %d concerning clauses", len(all_findings))
             
             self._scan = scan
             self._findings = all_findings
+            
+            # Severity filters are read repeatedly by summaries, metadata and
+            # repr, so split the findings once here
+            self._by_severity = {severity: [] for severity in Severity}
+            for finding in all_findings:
+                self._by_severity[finding.severity].append(finding)
             self._executed = True
         
         finally:
+            # The client and extractors outlive the scan; only discovery's
+            # per-scan state is released
             discovery.close()
-            extraction.close()
     
     def summarizeHigh(self) -> 'FilteredScanOperation':
         """Filter to high severity findings only."""
@@ -114,12 +170,11 @@ class ScanOperation:
     
     def get_findings(self, severity: Optional[Severity] = None) -> list[Finding]:
         """Get findings with optional severity filter."""
+        # _execute either raises or leaves both the findings list and its
+        # severity split in place, so no fallbacks are needed here
         self._execute()
         
-        if severity is None:
-            return self._findings or []
-        
-        return [f for f in (self._findings or []) if f.severity == severity]
+        return self._findings if severity is None else self._by_severity[severity]
 
 
 class FilteredScanOperation:
@@ -131,6 +186,10 @@ class FilteredScanOperation:
         self.severity_filter = severity
         self.category_filter = None
         self._result = None
+        
+        # metadata() for the filters it was built under
+        self._metadata = None
+        self._metadata_key = None
     
     @property
     def findings(self) -> list[Finding]:
@@ -147,6 +206,7 @@ class FilteredScanOperation:
         try:
             cat = Category(category_name)
             self.category_filter = cat
+            self._result = None
         except ValueError:
             print(f"⚠️  Unknown category: {category_name}")
             print(f"Valid categories: {', '.join([c.value for c in Category])}")
@@ -175,6 +235,11 @@ class FilteredScanOperation:
         """Get metadata about the scan including policy URLs and update dates."""
         self.parent._execute()
         
+        # Built once per filter combination; __repr__ and result both ask for it
+        key = (self.severity_filter, self.category_filter)
+        if self._metadata is not None and self._metadata_key == key:
+            return self._metadata
+        
         findings = self._get_filtered_findings()
         
         # Build policy documents list from ALL fetched documents, not just ones with findings
@@ -186,40 +251,50 @@ class FilteredScanOperation:
                 'last_updated': doc.last_updated
             })
         
+        severity_breakdown, category_breakdown = self._get_breakdowns(findings)
+        
         metadata = {
             'scan_id': self.parent.scan_id,
             'domain': self.parent.domain,
             'total_findings': len(findings),
-            'severity_breakdown': self._get_severity_breakdown(findings),
-            'category_breakdown': self._get_category_breakdown(findings),
+            'severity_breakdown': severity_breakdown,
+            'category_breakdown': category_breakdown,
             'policy_documents': policy_documents
         }
         
+        self._metadata = metadata
+        self._metadata_key = key
         return metadata
     
     def _get_filtered_findings(self) -> list[Finding]:
         """Get findings with current filters applied."""
+        # The severity filter is a lookup of the per-scan split, so the
+        # category filter is the only pass over findings, and only over
+        # that severity's share; enum members are singletons, so `is` suffices
         findings = self.parent.get_findings(self.severity_filter)
         
-        if self.category_filter:
-            findings = [f for f in findings if f.category == self.category_filter]
+        category = self.category_filter
+        if category is not None:
+            findings = [f for f in findings if f.category is category]
         
         return findings
     
-    def _get_severity_breakdown(self, findings: list[Finding]) -> dict:
-        """Get count by severity."""
-        breakdown = {'high': 0, 'medium': 0, 'low': 0}
-        for f in findings:
-            breakdown[f.severity.value] += 1
-        return breakdown
-    
-    def _get_category_breakdown(self, findings: list[Finding]) -> dict:
-        """Get count by category."""
-        breakdown = {}
-        for f in findings:
-            cat = f.category.value
-            breakdown[cat] = breakdown.get(cat, 0) + 1
-        return breakdown
+    def _get_breakdowns(self, findings: list[Finding]) -> tuple[dict, dict]:
+        """
+        Get counts by severity and by category.
+        
+        One pass tallies (severity, category) pairs; the few distinct pairs
+        are then folded into both breakdowns, reading .value once per pair.
+        Counter keeps first-seen order, so categories appear as they used to.
+        """
+        severity_breakdown = {'high': 0, 'medium': 0, 'low': 0}
+        category_breakdown = {}
+        
+        for (severity, category), count in Counter((f.severity, f.category) for f in findings).items():
+            severity_breakdown[severity.value] += count
+            category_breakdown[category.value] = category_breakdown.get(category.value, 0) + count
+        
+        return severity_breakdown, category_breakdown
     
     def _execute_and_build_result(self) -> ScanResult:
         """Execute scan and build result."""
@@ -244,56 +319,58 @@ class FilteredScanOperation:
         return result
     
     def __repr__(self) -> str:
-        """String representation for terminal output."""
+        """
+        Identify the operation without running it.
+        
+        Debuggers, tracebacks and log calls repr objects freely, so this must
+        never start a scan; the report itself is str().
+        """
+        severity = self.severity_filter.value if self.severity_filter else None
+        category = self.category_filter.value if self.category_filter else None
+        return (
+            f"<FilteredScanOperation domain={self.parent.domain!r} severity={severity!r} "
+            f"category={category!r} executed={self.parent._executed}>"
+        )
+    
+    def __str__(self) -> str:
+        """Scan report for terminal output; runs the scan if it has not run yet."""
         result = self._execute_and_build_result()
         
-        output = []
-        output.append(f"\n{'='*80}")
-        output.append(f"PolicyBoom Scan Results - {result.scan.domain}")
-        output.append(f"{'='*80}\n")
+        metadata = result.metadata
         
-        output.append(f"Scan ID: {result.scan.id}")
-        output.append(f"Total Findings: {len(result.findings)}")
+        output = [
+            f"\n{_RULE}\nPolicyBoom Scan Results - {result.scan.domain}\n{_RULE}\n",
+            f"Scan ID: {result.scan.id}\nTotal Findings: {len(result.findings)}"
+        ]
         
         if self.severity_filter:
             output.append(f"Filtered by: {self.severity_filter.value.upper()} severity")
         if self.category_filter:
             output.append(f"Category: {self.category_filter.value}")
         
-        output.append(f"\nSeverity Breakdown:")
-        for sev, count in result.metadata['severity_breakdown'].items():
-            output.append(f"  {sev.upper()}: {count}")
+        output.append("\nSeverity Breakdown:")
+        output.extend(f"  {sev.upper()}: {count}" for sev, count in metadata['severity_breakdown'].items())
         
-        output.append(f"\nCategory Breakdown:")
-        for cat, count in result.metadata['category_breakdown'].items():
-            output.append(f"  {cat}: {count}")
+        output.append("\nCategory Breakdown:")
+        output.extend(f"  {cat}: {count}" for cat, count in metadata['category_breakdown'].items())
         
         if result.findings:
-            output.append(f"\n{'─'*80}")
-            output.append(f"Top Findings:\n")
-            
-            for i, finding in enumerate(result.findings[:10], 1):
-                output.append(f"{i}. [{finding.severity.value.upper()}] {finding.matched_pattern}")
-                output.append(f"   Section: {finding.section_title}")
-                output.append(f"   Document: {finding.document_type}")
-                if finding.last_updated:
-                    output.append(f"   Last Updated: {finding.last_updated}")
-                output.append(f"   Snippet: {finding.snippet[:150]}...")
-                output.append(f"   Source: {finding.document_url}\n")
+            output.append(f"\n{_DIVIDER}\nTop Findings:\n")
+            output.extend(
+                _format_finding(i, finding) for i, finding in enumerate(islice(result.findings, 10), 1)
+            )
         
         # Always show policy documents analyzed
-        policy_docs = result.metadata.get('policy_documents', [])
+        policy_docs = metadata.get('policy_documents', [])
         if policy_docs:
-            output.append(f"{'─'*80}")
-            output.append(f"Policy Documents Analyzed:\n")
-            for doc in policy_docs:
-                doc_type = doc.get('type', 'Unknown')
-                last_updated = doc.get('last_updated', 'Unknown')
-                url = doc.get('url', '')
-                output.append(f"  • {doc_type} (Updated: {last_updated})")
-                output.append(f"    {url}\n")
+            output.append(f"{_DIVIDER}\nPolicy Documents Analyzed:\n")
+            output.extend(
+                f"  • {doc.get('type', 'Unknown')} (Updated: {doc.get('last_updated', 'Unknown')})\n"
+                f"    {doc.get('url', '')}\n"
+                for doc in policy_docs
+            )
         
-        output.append(f"{'='*80}\n")
+        output.append(f"{_RULE}\n")
         
         return '\n'.join(output)
     
@@ -304,6 +381,20 @@ class FilteredScanOperation:
         print(f"✅ Results exported to {filename}")
 
 
+def _format_finding(index: int, finding: Finding) -> str:
+    """Render one numbered finding of the terminal report as a single block."""
+    last_updated = f"   Last Updated: {finding.last_updated}\n" if finding.last_updated else ""
+    
+    return (
+        f"{index}. [{_SEVERITY_LABELS[finding.severity]}] {finding.matched_pattern}\n"
+        f"   Section: {finding.section_title}\n"
+        f"   Document: {finding.document_type}\n"
+        f"{last_updated}"
+        f"   Snippet: {finding.snippet[:150]}...\n"
+        f"   Source: {finding.document_url}\n"
+    )
+
+
 def scan(domain: str, db: Optional[Database] = None) -> ScanOperation:
     """
     Start a new scan operation with fluent API.
@@ -314,3 +405,41 @@ def scan(domain: str, db: Optional[Database] = None) -> ScanOperation:
         scan("example.com").summarizeAll().metadata()
     """
     return ScanOperation(domain, db)
+
+
+async def scan_many(
+    domains: list[str],
+    concurrency: int = 10,
+    db: Optional[Database] = None
+) -> list[Optional[ScanResult]]:
+    """
+    Scan several domains concurrently, returning their results in order.
+    
+    Each blocking scan runs on a pool of concurrency worker threads, and
+    all of them write to one database. A domain whose scan fails gets None.
+    
+    Examples:
+        results = asyncio.run(scan_many(["slack.com", "stripe.com"]))
+    """
+    owns_db = db is None
+    db = db or Database()
+    loop = asyncio.get_running_loop()
+    
+    def run(domain: str) -> ScanResult:
+        return scan(domain, db).summarizeAll().result
+    
+    async def scan_one(domain: str, executor: ThreadPoolExecutor) -> Optional[ScanResult]:
+        try:
+            return await loop.run_in_executor(executor, run, domain)
+        except Exception as e:
+            log.warning("⚠️  Scan of %s failed: %s", domain, e)
+            return None
+    
+    try:
+        # The pool's size is the concurrency limit; asyncio.to_thread's shared
+        # executor would cap it at a few threads on small machines
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return await asyncio.gather(*(scan_one(domain, executor) for domain in domains))
+    finally:
+        if owns_db:
+            db.close()
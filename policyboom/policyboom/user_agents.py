@@ -5,6 +5,7 @@ Provides realistic browser user-agents to avoid bot detection.
 """
 
 import random
+from importlib.util import find_spec
 
 USER_AGENTS = [
     # Chrome on Windows
@@ -39,6 +40,15 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
 ]
 
+# Only advertise encodings httpx can decode here: br and zstd need the
+# optional brotli and zstandard packages, and a body in an undecodable
+# encoding is handed back still compressed
+_ACCEPT_ENCODING = ", ".join(
+    ["gzip", "deflate"]
+    + (["br"] if find_spec("brotli") or find_spec("brotlicffi") else [])
+    + (["zstd"] if find_spec("zstandard") else [])
+)
+
 
 def get_random_user_agent() -> str:
     """
@@ -64,7 +74,7 @@ def get_headers(additional_headers: dict | None = None) -> dict:
         "User-Agent": get_random_user_agent(),
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
+        "Accept-Encoding": _ACCEPT_ENCODING,
         "DNT": "1",
         "Connection": "keep-alive",
         "Upgrade-Insecure-Requests": "1",
@@ -1,7 +1,22 @@
 """Utility functions for PolicyBoom."""
 
+import asyncio
 import re
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from urllib.parse import quote
+from lxml import html as lxml_html
+
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+_HTTP2_AVAILABLE = find_spec('h2') is not None
+
+# Every finding builds a fragment URL, so the pattern is compiled once here
+_WS_RE = re.compile(r'\s+')
+
+# Common filler words skipped at the start of a fragment snippet
+_STOPWORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
 
 
 def generate_text_fragment_url(base_url: str, text: str, max_words: int = None) -> str:
@@ -28,7 +43,7 @@ def generate_text_fragment_url(base_url: str, text: str, max_words: int = None)
         'https://example.com/policy#:~:text=agree%20to%20binding%20arbitration%20and%20waive'
     """
     # Clean and normalize text
-    clean_text = re.sub(r'\s+', ' ', text.strip())
+    clean_text = _WS_RE.sub(' ', text.strip())
     
     # Use all words for maximum precision (unless max_words specified)
     if max_words is not None:
@@ -65,17 +80,11 @@ def extract_unique_snippet(text: str, min_words: int = 3, max_words: int = 7) ->
     Returns:
         Snippet suitable for text fragment URL
     """
-    # Remove common filler words for better uniqueness
-    stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-    
     words = text.strip().split()
     
-    # Find first sequence with at least one non-stopword
-    best_start = 0
-    for i in range(len(words)):
-        if words[i].lower() not in stopwords:
-            best_start = i
-            break
+    # Start at the first non-stopword for better uniqueness; only the words
+    # up to it are lowercased
+    best_start = next((i for i, word in enumerate(words) if word.lower() not in _STOPWORDS), 0)
     
     # Extract snippet starting from best position
     end_idx = min(best_start + max_words, len(words))
@@ -87,3 +96,122 @@ def extract_unique_snippet(text: str, min_words: int = 3, max_words: int = 7) ->
         snippet_words = words[best_start:end_idx]
     
     return ' '.join(snippet_words)
+
+
+def parse_html(html: str):
+    """
+    Parse an HTML string into an lxml element tree.
+    
+    lxml walks the tree in C, avoiding BeautifulSoup's per-node Python objects.
+    
+    Args:
+        html: Decoded HTML markup
+    
+    Returns:
+        Root lxml.html element
+    """
+    try:
+        return lxml_html.fromstring(html)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration
+        return lxml_html.fromstring(html.encode('utf-8'))
+
+
+def strip_scripts(root) -> None:
+    """
+    Empty the <script> and <style> elements of a parsed tree, in place.
+    
+    BeautifulSoup's get_text leaves their contents out, while lxml's text
+    helpers include them; emptying them first keeps the two in step. The
+    elements themselves stay, so the text after each one remains a separate
+    text node rather than merging with the text before it.
+    
+    Args:
+        root: lxml element returned by parse_html
+    """
+    for element in list(root.iter('script', 'style')):
+        element.clear(keep_tail=True)
+
+
+def element_text(element, separator: str = ' ') -> str:
+    """
+    Join an element's stripped, non-empty text nodes, like BeautifulSoup's get_text(strip=True).
+    
+    Args:
+        element: lxml element
+        separator: String placed between text nodes
+    
+    Returns:
+        Element text
+    """
+    return separator.join(
+        text.strip() for text in element.itertext() if text.strip()
+    )
+
+
+def create_http_client(timeout: float = 15) -> httpx.Client:
+    """
+    Build the HTTP client shared by discovery and extraction.
+    
+    Reusing one pooled client keeps TCP/TLS connections to a host alive across
+    components; with h2 installed, requests to one origin multiplex over a
+    single HTTP/2 connection.
+    
+    Args:
+        timeout: Default request timeout in seconds
+    
+    Returns:
+        Configured httpx.Client
+    """
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30)
+    
+    # An explicit transport ignores the client's http2/limits arguments,
+    # so both are configured on the transport itself
+    transport = httpx.HTTPTransport(http2=_HTTP2_AVAILABLE, limits=limits, retries=0)
+    
+    return httpx.Client(timeout=timeout, follow_redirects=True, transport=transport)
+
+
+def create_async_http_client(timeout: float = 15, max_connections: int = 64) -> httpx.AsyncClient:
+    """
+    Build a pooled async HTTP client for concurrent page fetches.
+    
+    Args:
+        timeout: Default request timeout in seconds
+        max_connections: Upper bound on open connections across hosts
+    
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    limits = httpx.Limits(
+        max_keepalive_connections=max_connections // 2,
+        max_connections=max_connections,
+        keepalive_expiry=30
+    )
+    transport = httpx.AsyncHTTPTransport(http2=_HTTP2_AVAILABLE, limits=limits, retries=0)
+    
+    return httpx.AsyncClient(timeout=timeout, follow_redirects=True, transport=transport)
+
+
+def run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code and return its result.
+    
+    asyncio.run refuses to start inside a running event loop (Jupyter, async
+    web handlers, code driving scan_many from its own loop), so there the
+    coroutine gets a fresh loop on a worker thread and this call blocks
+    until it finishes.
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        Whatever the coroutine returns; its exceptions propagate
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
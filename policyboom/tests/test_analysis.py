@@ -0,0 +1,40 @@
+from policyboom.analysis import Analysis
+from policyboom.models import Clause
+
+
+def _clause(text: str) -> Clause:
+    return Clause(
+        id="clause_0",
+        text=text,
+        section_title="General",
+        paragraph_index=0,
+        document_url="https://example.com/terms",
+    )
+
+
+def test_extract_snippet_keeps_character_window():
+    analysis = Analysis()
+    text = "x" * 150 + " arbitration " + "y" * 150
+    start = text.index("arbitration")
+    end = start + len("arbitration")
+    
+    snippet = analysis._extract_snippet(text, start, end)
+    
+    # A plain 100-character slice either side, even when it cuts a word
+    assert snippet == "..." + text[start - 100:end + 100] + "..."
+
+
+def test_extract_snippet_short_text_has_no_ellipses():
+    analysis = Analysis()
+    
+    assert analysis._extract_snippet("  we sell data  ", 5, 9) == "we sell data"
+
+
+def test_analyze_clause_finds_arbitration():
+    findings = Analysis().analyze_clause(
+        _clause("Any dispute will be resolved by binding arbitration on an individual basis.")
+    )
+    
+    assert findings
+    assert all("arbitration" in finding.snippet for finding in findings)
+    assert all(finding.document_url.startswith("https://example.com/terms#:~:text=") for finding in findings)
@@ -0,0 +1,85 @@
+import sqlite3
+
+from policyboom.database import Database, SCHEMA_VERSION
+
+
+def _user_version(path) -> int:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _columns(db: Database, table: str) -> set[str]:
+    return {row[1] for row in db.conn.execute(f"PRAGMA table_info({table})")}
+
+
+def test_new_database_is_stamped(tmp_path):
+    path = str(tmp_path / "scans.db")
+    db = Database(path)
+    db.close()
+    
+    assert _user_version(path) == SCHEMA_VERSION
+
+
+def test_legacy_database_is_migrated(tmp_path):
+    path = str(tmp_path / "scans.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE clauses (
+            id TEXT PRIMARY KEY,
+            document_id INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            section_title TEXT,
+            paragraph_index INTEGER,
+            document_url TEXT
+        );
+        CREATE TABLE findings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            clause_id TEXT NOT NULL,
+            scan_id TEXT NOT NULL,
+            category TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            text TEXT NOT NULL
+        );
+        INSERT INTO clauses (id, document_id, text) VALUES ('c1', 1, 'We sell data.');
+    """)
+    conn.close()
+    
+    db = Database(path)
+    
+    assert {'document_type', 'last_updated', 'context_before', 'context_after'} <= _columns(db, 'clauses')
+    assert {'document_type', 'full_text', 'context_before', 'context_after', 'last_updated'} <= _columns(db, 'findings')
+    assert {'scans', 'documents', 'url_probe_cache'} <= {
+        row[0] for row in db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    assert db.conn.execute("SELECT text FROM clauses WHERE id = 'c1'").fetchone()[0] == 'We sell data.'
+    db.close()
+    
+    assert _user_version(path) == SCHEMA_VERSION
+
+
+def test_current_database_skips_schema_setup(tmp_path):
+    path = str(tmp_path / "scans.db")
+    Database(path).close()
+    
+    conn = sqlite3.connect(path)
+    conn.execute("DROP INDEX idx_clauses_doc")
+    conn.close()
+    
+    # Stamped with SCHEMA_VERSION, so no DDL runs and the index stays dropped
+    db = Database(path)
+    indexes = {row[0] for row in db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    db.close()
+    
+    assert 'idx_clauses_doc' not in indexes
+
+
+def test_url_probe_round_trip(tmp_path):
+    db = Database(str(tmp_path / "scans.db"))
+    
+    assert db.get_url_probe('example.com', '/privacy') is None
+    db.save_url_probe('example.com', '/privacy', 200)
+    assert db.get_url_probe('example.com', '/privacy') == 200
+    db.close()
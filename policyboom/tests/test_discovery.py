@@ -0,0 +1,60 @@
+import asyncio
+
+import httpx
+import pytest
+
+from policyboom import discovery
+from policyboom.discovery import Discovery
+
+
+HOMEPAGE = (
+    '<html><body>'
+    '<a href="/privacy#cookies">Privacy</a>'
+    '<a href="/about">About</a>'
+    '</body></html>'
+)
+
+EXISTING = {'/', '/privacy', '/terms'}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.host != 'example.com' or request.url.path not in EXISTING:
+        return httpx.Response(404)
+    if request.url.query:
+        return httpx.Response(404)
+    return httpx.Response(200, headers={'content-type': 'text/html'}, text=HOMEPAGE)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    transport = httpx.MockTransport(_handler)
+    monkeypatch.setattr(
+        discovery, 'create_async_http_client',
+        lambda timeout, max_connections: httpx.AsyncClient(transport=transport)
+    )
+    monkeypatch.setattr(discovery.random, 'uniform', lambda a, b: 0)
+    return Discovery(client=httpx.Client(transport=transport), max_docs=50)
+
+
+def test_discover_finds_existing_policies(engine):
+    found = {doc['url']: doc['doc_type'] for doc in engine.discover('example.com')}
+    
+    assert found == {
+        'https://example.com/privacy': 'Privacy Policy',
+        'https://example.com/terms': 'Terms of Service',
+    }
+
+
+def test_discover_inside_running_loop(engine):
+    async def caller():
+        return engine.discover('example.com')
+    
+    assert len(asyncio.run(caller())) == 2
+
+
+def test_discover_seed_failure_returns_empty(engine):
+    assert engine.discover('https://example.com/missing') == []
+
+
+def test_discover_invalid_url_returns_empty():
+    assert Discovery().discover('exa mple..com:99999') == []
@@ -0,0 +1,56 @@
+import asyncio
+
+import httpx
+
+from policyboom.extraction import Extraction
+
+
+PAGE = (
+    "<html><head><title>Terms of Service</title></head><body>"
+    "<h2>Disputes</h2>"
+    "<p>Last updated: March 3, 2024. You agree to binding arbitration and waive "
+    "your right to participate in a class action against us.</p>"
+    "</body></html>"
+)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/missing":
+        return httpx.Response(404)
+    return httpx.Response(200, headers={"content-type": "text/html"}, text=PAGE)
+
+
+def _extraction() -> Extraction:
+    client = httpx.Client(transport=httpx.MockTransport(_handler))
+    return Extraction(client=client)
+
+
+ITEMS = [
+    ("https://example.com/terms", "Terms of Service"),
+    ("https://example.com/missing", "Privacy Policy"),
+    ("https://example.com/privacy", "Privacy Policy"),
+]
+
+
+def test_extract_documents_keeps_order():
+    documents = _extraction().extract_documents(ITEMS)
+    
+    assert [doc and doc.url for doc in documents] == [
+        "https://example.com/terms", None, "https://example.com/privacy"
+    ]
+    assert documents[0].title == "Terms of Service"
+    assert documents[0].last_updated == "March 3, 2024"
+    assert documents[0].clauses
+
+
+def test_extract_documents_inside_running_loop():
+    async def caller():
+        return _extraction().extract_documents(ITEMS)
+    
+    documents = asyncio.run(caller())
+    
+    assert [doc is not None for doc in documents] == [True, False, True]
+
+
+def test_extract_documents_empty():
+    assert _extraction().extract_documents([]) == []
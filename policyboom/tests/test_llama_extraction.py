@@ -0,0 +1,141 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from policyboom import llama_extraction
+from policyboom.llama_extraction import LlamaExtractor
+from policyboom.llm_cache import LLMCache
+
+
+PAGE = (
+    "<html><head><title>Privacy Policy</title></head><body>"
+    + "<p>Last updated: March 3, 2024. We may sell your data to partners and share it widely.</p>" * 20
+    + "</body></html>"
+)
+
+REPLY = json.dumps([{
+    "text": "We may sell your data",
+    "section": "Sharing",
+    "category": "dataSale",
+    "severity": "high",
+    "reason": "Data sale"
+}])
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/missing":
+        return httpx.Response(404)
+    return httpx.Response(200, headers={"content-type": "text/html"}, text=PAGE)
+
+
+class FakeAsyncOpenAI:
+    """Stands in for AsyncOpenAI; the fast model flags paragraph 0, the main model returns REPLY."""
+    
+    calls: list[str] = []
+    
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+    
+    async def _create(self, **request):
+        FakeAsyncOpenAI.calls.append(request["model"])
+        content = "[0]" if "8B" in request["model"] else REPLY
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    monkeypatch.setenv("TOGETHER_API_KEY", "test-key")
+    monkeypatch.setattr(llama_extraction, "AsyncOpenAI", FakeAsyncOpenAI)
+    monkeypatch.setattr(
+        llama_extraction, "create_async_http_client",
+        lambda timeout: httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    )
+    FakeAsyncOpenAI.calls = []
+    
+    extractor = LlamaExtractor(cache=LLMCache(":memory:"))
+    # Threads stand in for the process pool, which tests need not start;
+    # close() shuts it down like the real one
+    extractor._parse_pool = ThreadPoolExecutor(max_workers=2)
+    yield extractor
+    extractor.close()
+    extractor.cache.close()
+
+
+def _extract_clauses(extractor: LlamaExtractor, text: str):
+    async def run():
+        return await extractor._extract_clauses_with_ai(
+            FakeAsyncOpenAI(), text, "https://example.com/privacy", "Privacy Policy", None
+        )
+    
+    return asyncio.run(run())
+
+
+def test_cache_key_covers_models_and_prompt_version(extractor, monkeypatch):
+    key = extractor._cache_key("We sell data.")
+    
+    assert extractor._cache_key("We sell data.") == key
+    assert extractor._cache_key("We share data.") != key
+    
+    extractor.model = "other-model"
+    assert extractor._cache_key("We sell data.") != key
+    
+    monkeypatch.setattr(llama_extraction, "PROMPT_VERSION", llama_extraction.PROMPT_VERSION + 1)
+    extractor.model = "meta-llama/Llama-3.3-70B-Instruct-Turbo"
+    assert extractor._cache_key("We sell data.") != key
+
+
+def test_cached_reply_skips_the_model(extractor, monkeypatch):
+    text = "We may sell your data to partners."
+    
+    first = _extract_clauses(extractor, text)
+    calls = len(FakeAsyncOpenAI.calls)
+    second = _extract_clauses(extractor, text)
+    
+    assert calls == 1
+    assert len(FakeAsyncOpenAI.calls) == calls
+    assert first == second
+    assert first[0].ai_category == "dataSale"
+    
+    # A new prompt version misses the old entry
+    monkeypatch.setattr(llama_extraction, "PROMPT_VERSION", llama_extraction.PROMPT_VERSION + 1)
+    _extract_clauses(extractor, text)
+    assert len(FakeAsyncOpenAI.calls) == calls + 1
+    
+    # So does a different model
+    extractor.model = "other-model"
+    _extract_clauses(extractor, text)
+    assert len(FakeAsyncOpenAI.calls) == calls + 2
+
+
+def test_extract_document(extractor):
+    document = extractor.extract_document("https://example.com/privacy", "Privacy Policy")
+    
+    assert document.title == "Privacy Policy"
+    assert document.last_updated == "March 3, 2024"
+    assert [clause.ai_category for clause in document.clauses] == ["dataSale"]
+
+
+def test_sync_wrappers_inside_running_loop(extractor):
+    async def caller():
+        single = extractor.extract_document("https://example.com/privacy", "Privacy Policy")
+        several = extractor.extract_documents([
+            ("https://example.com/privacy", "Privacy Policy"),
+            ("https://example.com/missing", "Terms of Service"),
+        ])
+        return single, several
+    
+    single, several = asyncio.run(caller())
+    
+    assert single.title == "Privacy Policy"
+    assert several[0] == single
+    assert several[1] is None
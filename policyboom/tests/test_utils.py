@@ -0,0 +1,36 @@
+import asyncio
+import threading
+
+import pytest
+
+from policyboom.utils import run_sync
+
+
+async def _current_thread_name():
+    await asyncio.sleep(0)
+    return threading.current_thread().name
+
+
+async def _fail():
+    raise ValueError("boom")
+
+
+def test_run_sync_without_running_loop():
+    assert run_sync(_current_thread_name()) == threading.current_thread().name
+
+
+def test_run_sync_inside_running_loop():
+    async def caller():
+        # asyncio.run would raise here; run_sync moves to a worker thread
+        return run_sync(_current_thread_name())
+    
+    name = asyncio.run(caller())
+    assert name != threading.current_thread().name
+
+
+def test_run_sync_propagates_exceptions_inside_running_loop():
+    async def caller():
+        return run_sync(_fail())
+    
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(caller())